@@ -8,14 +8,28 @@ Usage:
     python build.py                    # Build all components
     python build.py --component form   # Build specific component
     python build.py --debug            # Debug build (faster, with console)
-    python build.py --clean            # Clean build artifacts
+    python build.py --pgo              # Profile-guided optimized release build
+    python build.py --compression fast # Skip onefile compression (quicker iteration)
+    python build.py --aggressive       # Static libpython, isolated mode
+    python build.py --multiplex        # One shared binary, components as symlinks (not with --pgo)
+    python build.py --fresh            # Discard intermediate build files after building
+    python build.py --clean            # Clean build artifacts (keeps compiler caches)
+    python build.py --deep-clean       # Clean build artifacts and compiler caches
     python build.py --help             # Show help
 """
 
 import argparse
+import filecmp
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
+import os
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 try:
@@ -35,51 +49,97 @@ SRC_DIR = PROJECT_ROOT / "src"
 DIST_DIR = PROJECT_ROOT / "dist"
 BUILD_DIR = PROJECT_ROOT / "build"
 
-# Component definitions: (module_path, output_name)
-COMPONENTS = {
-    "launcher": ("glaze.__main__", "glaze-launcher"),
-    "form": ("glaze.components.form", "login-form"),
-    "data_table": ("glaze.components.data_table", "data-table"),
-    "settings": ("glaze.components.settings", "settings-dialog"),
-}
+# Persistent compiler caches reused across builds (survive --clean)
+NUITKA_CACHE_DIR = PROJECT_ROOT / ".nuitka-cache"
+CCACHE_DIR = PROJECT_ROOT / ".ccache"
 
 
-def log_info(message: str):
-    """Log informational message."""
-    if RICH_AVAILABLE and _console:
-        _console.print(f"[blue]INFO:[/blue] {message}")
-    else:
-        print(f"INFO: {message}")
+def _load_components() -> dict[str, tuple[str, str]]:
+    """Read the component table from glaze/multiplex.py.
 
+    Loaded by path, so the glaze package (and Qt) isn't imported, and the
+    multiplex binary dispatches on exactly the names built here.
+    """
+    spec = importlib.util.spec_from_file_location(
+        "_glaze_multiplex", SRC_DIR / "glaze" / "multiplex.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.COMPONENTS
 
-def log_success(message: str):
-    """Log success message."""
-    if RICH_AVAILABLE and _console:
-        _console.print(f"[green]SUCCESS:[/green] {message}")
-    else:
-        print(f"SUCCESS: {message}")
 
+# Component definitions: name -> (module_path, output_name)
+COMPONENTS = _load_components()
 
-def log_warning(message: str):
-    """Log warning message."""
-    if RICH_AVAILABLE and _console:
-        _console.print(f"[yellow]WARNING:[/yellow] {message}")
-    else:
-        print(f"WARNING: {message}")
+# Shared binary for --multiplex builds; dispatches on the name it is run as
+MULTIPLEX_COMPONENT = ("glaze.multiplex", "glaze-multiplex")
+
+# Stdlib packages never imported by glaze (checked with python -X importtime),
+# excluded from every build so Nuitka doesn't analyze them. email, xml and
+# http are deliberately absent: importlib.metadata and Pillow use them.
+PRUNED_STDLIB = [
+    "tkinter", "turtle", "test", "unittest", "pydoc", "doctest", "xmlrpc", "lib2to3",
+]
 
+# Qt plugin families glaze never needs (it only uses QtCore, QtGui and
+# QtWidgets); excluded from the plugin's "sensible" default set. Image
+# format plugins must stay, the stylesheets load an SVG.
+UNUSED_QT_PLUGINS = [
+    "printsupport", "qmltooling", "multimedia", "tls", "networkinformation", "sqldrivers",
+]
+
+# Distributions bundled into the binaries; their versions are part of the
+# build fingerprint so an upgrade triggers a rebuild
+BUNDLED_DISTRIBUTIONS = ("PySide6", "Pillow")
+
+# CPU cores this process may actually use (respects taskset/cgroup cpusets,
+# e.g. in Docker CI), falling back to the machine's core count
+try:
+    AVAILABLE_CORES = len(os.sched_getaffinity(0))
+except AttributeError:
+    AVAILABLE_CORES = os.cpu_count() or 1
 
-def log_error(message: str):
-    """Log error message."""
+# Serializes log output when components are built concurrently
+_log_lock = threading.Lock()
+
+
+def _make_logger(label: str, style: str):
+    """Create a log function for one level.
+
+    Rich vs plain output is resolved here, once, instead of on every call.
+    """
     if RICH_AVAILABLE and _console:
-        _console.print(f"[red]ERROR:[/red] {message}")
+        console = _console
+
+        def log(message: str):
+            with _log_lock:
+                console.print(f"[{style}]{label}:[/{style}] {message}")
     else:
-        print(f"ERROR: {message}")
+        def log(message: str):
+            with _log_lock:
+                print(f"{label}: {message}")
+
+    log.__doc__ = f"Log {label.lower()} message."
+    return log
 
 
-def clean_build_artifacts():
-    """Remove build and dist directories."""
+log_info = _make_logger("INFO", "blue")
+log_success = _make_logger("SUCCESS", "green")
+log_warning = _make_logger("WARNING", "yellow")
+log_error = _make_logger("ERROR", "red")
+
+
+def clean_build_artifacts(deep: bool = False):
+    """Remove build and dist directories.
+
+    Args:
+        deep: If True, also remove the Nuitka and ccache compiler caches
+    """
     log_info("Cleaning build artifacts...")
-    for directory in [DIST_DIR, BUILD_DIR]:
+    directories = [DIST_DIR, BUILD_DIR]
+    if deep:
+        directories.extend([NUITKA_CACHE_DIR, CCACHE_DIR])
+    for directory in directories:
         if directory.exists():
             shutil.rmtree(directory)
             log_info(f"  Removed {directory}")
@@ -87,13 +147,154 @@ def clean_build_artifacts():
     print()
 
 
-def build_component(module_path: str, output_name: str, debug: bool = False):
+@functools.cache
+def detect_c_compiler() -> str:
+    """Detect the backend C compiler family ('clang', 'gcc' or 'unknown').
+
+    Honors the CC environment variable like Nuitka does.
+    """
+    try:
+        result = subprocess.run(
+            [os.environ.get("CC", "cc"), "--version"],
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+    output = result.stdout.lower()
+    if "clang" in output:
+        return "clang"
+    if "gcc" in output or "free software foundation" in output:
+        return "gcc"
+    return "unknown"
+
+
+def get_lto_env(compiler: str) -> dict[str, str]:
+    """Return extra compiler/linker flags for the production LTO build.
+
+    Clang gets ThinLTO so the link step runs across all cores (Nuitka itself
+    only knows full LTO). GCC already parallelizes LTO through Nuitka's
+    -flto=<jobs>. Both get section GC to drop unreferenced code from the binary.
+    """
+    ccflags = ["-ffunction-sections", "-fdata-sections"]
+    ldflags = ["-Wl,--gc-sections"]
+    if compiler == "clang":
+        ccflags.insert(0, "-flto=thin")
+        ldflags.insert(0, "-flto=thin")
+    elif compiler != "gcc":
+        return {}
+
+    return {
+        "CCFLAGS": " ".join([os.environ.get("CCFLAGS", ""), *ccflags]).strip(),
+        "LDFLAGS": " ".join([os.environ.get("LDFLAGS", ""), *ldflags]).strip(),
+    }
+
+
+def get_build_env(debug: bool = False, pgo: bool = False) -> dict[str, str]:
+    """Return the environment for Nuitka with persistent compiler caches.
+
+    Values already set in the environment (e.g. by CI) take precedence.
+
+    Args:
+        debug: If True, skip the production LTO flags
+        pgo: If True, let the instrumented profiling run start without a display
+    """
+    env = os.environ.copy()
+    env.setdefault("NUITKA_CACHE_DIR", str(NUITKA_CACHE_DIR))
+    env.setdefault("CCACHE_DIR", str(CCACHE_DIR))
+    env.setdefault("CCACHE_COMPILERCHECK", "content")
+    if not debug:
+        env.update(get_lto_env(detect_c_compiler()))
+    if pgo:
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+
+@functools.cache
+def get_nuitka_version() -> str | None:
+    """Return the `nuitka --version` output, or None if Nuitka is not installed."""
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", "nuitka", "--version"],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return result.stdout
+
+
+@functools.cache
+def _bundled_versions() -> str:
+    """Return the installed versions of BUNDLED_DISTRIBUTIONS, one per line."""
+    versions = []
+    for name in BUNDLED_DISTRIBUTIONS:
+        try:
+            version = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            version = ""
+        versions.append(f"{name}=={version}")
+    return "\n".join(versions)
+
+
+def _source_fingerprint(cmd: list[str]) -> str:
+    """Hash everything that determines a build's output.
+
+    Covers every file in the glaze package (the build includes the whole
+    package), the Nuitka, Python and bundled dependency versions, the
+    Nuitka command line and the extra compiler flags. Options that don't
+    change the binary (--jobs, --remove-output) are left out, so a
+    single-component build and build-all share the cache.
+    """
+    package_dir = SRC_DIR / "glaze"
+    files = sorted(
+        path for path in package_dir.rglob("*")
+        if path.is_file() and "__pycache__" not in path.parts
+    )
+
+    with ThreadPoolExecutor() as executor:
+        digests = executor.map(lambda path: hashlib.blake2b(path.read_bytes()).digest(), files)
+        fingerprint = hashlib.blake2b()
+        for path, digest in zip(files, digests):
+            fingerprint.update(path.relative_to(package_dir).as_posix().encode())
+            fingerprint.update(digest)
+
+    fingerprint.update((get_nuitka_version() or "").encode())
+    fingerprint.update(sys.version.encode())
+    fingerprint.update(_bundled_versions().encode())
+    output_args = [
+        arg for arg in cmd if not arg.startswith("--jobs=") and arg != "--remove-output"
+    ]
+    fingerprint.update("\0".join(output_args).encode())
+    fingerprint.update(repr(sorted(get_lto_env(detect_c_compiler()).items())).encode())
+    return fingerprint.hexdigest()
+
+
+def build_component(
+    module_path: str,
+    output_name: str,
+    debug: bool = False,
+    jobs: int | None = None,
+    fresh: bool = False,
+    pgo: bool = False,
+    compression: str | None = None,
+    aggressive: bool = False,
+):
     """Build a single component using Nuitka.
 
     Args:
         module_path: Python module path (e.g., 'glaze.components.form')
         output_name: Output binary name (e.g., 'login-form')
         debug: If True, build in debug mode (faster, with console)
+        jobs: Parallel C compilation jobs (defaults to all available cores)
+        fresh: If True, remove intermediate build files after building
+        pgo: If True, do a two-stage profile-guided build (ignored in debug mode)
+        compression: 'fast' (uncompressed payload) or 'max' (zstd); defaults
+            to 'fast' for debug builds and 'max' otherwise
+        aggressive: If True, link libpython statically and run isolated
+            (ignored in debug mode)
     """
     log_info(f"Building {output_name}...")
 
@@ -116,17 +317,24 @@ def build_component(module_path: str, output_name: str, debug: bool = False):
         log_error(f"Could not find source file: {file_path}")
         return False
 
+    if jobs is None:
+        jobs = AVAILABLE_CORES
+
     # Base Nuitka command with optimizations
     cmd = [
         sys.executable, "-m", "nuitka",
         "--onefile",                       # Single compressed executable
         "--enable-plugin=pyside6",         # PySide6 plugin (handles Qt dependencies)
-        "--follow-imports",                # Include all imported modules
+        f"--noinclude-qt-plugins={','.join(UNUSED_QT_PLUGINS)}",
         "--output-dir=build",              # Build cache directory
         f"--output-filename={output_name}",       # Binary name
         "--assume-yes-for-downloads",      # Auto-download dependencies
-        "--jobs=4",                        # Parallel compilation (adjust based on CPU)
-        "--include-data-dir=src/glaze/assets=glaze/assets",
+        f"--jobs={jobs}",                  # Parallel C compilation
+        # Only the files the stylesheets reference (mirrors package-data in
+        # pyproject.toml); QSS url() needs real files, so they stay unbundled
+        "--include-data-files=src/glaze/assets/*.svg=glaze/assets/",
+        # --onefile already follows all imports; only prune what is never used
+        f"--nofollow-import-to={','.join(PRUNED_STDLIB)}",
     ]
 
     # Add --python-flag=-m for __main__ modules (recommended by Nuitka)
@@ -134,22 +342,36 @@ def build_component(module_path: str, output_name: str, debug: bool = False):
     if is_main_module:
         cmd.append("--python-flag=-m")
     else:
-        # Only include package for non-main modules
+        # Only include package for non-main modules; still needed because
+        # glaze/__init__.py and glaze.multiplex import modules by name
         cmd.append("--include-package=glaze")
 
     # Performance optimizations (production builds)
     if not debug:
         cmd.extend([
-            "--lto=yes",                       # Link-time optimization for smaller/faster binaries
-            # Compression is enabled by default when zstandard is installed
+            # Link-time optimization for smaller/faster binaries; ThinLTO/GC
+            # flags for known compilers are passed via get_build_env()
+            "--lto=yes" if detect_c_compiler() != "unknown" else "--lto=auto",
             "--noinclude-qt-translations",     # Skip unused Qt translations
             "--prefer-source-code",            # Use source over bytecode for better optimization
             "--python-flag=no_site",           # Skip site-packages overhead
             "--python-flag=no_docstrings",     # Remove docstrings (smaller binary)
             "--python-flag=no_asserts",        # Remove assert statements
-            "--remove-output",                 # Clean up intermediate build files
             "--quiet",                         # Reduce output noise
         ])
+        if aggressive:
+            cmd.extend([
+                "--static-libpython=auto",     # Avoid resolving libpython at startup
+                "--python-flag=isolated",      # Ignore user site and PYTHON* env vars
+            ])
+        if pgo:
+            # Nuitka builds an instrumented binary, runs it with --self-test
+            # (start up, then quit) and rebuilds using the collected profile
+            cmd.extend([
+                "--pgo-c",
+                "--pgo-args=--self-test",
+            ])
+            log_info("  PGO enabled (two-stage build)")
     # Debug mode options (faster compilation)
     else:
         cmd.extend([
@@ -158,12 +380,50 @@ def build_component(module_path: str, output_name: str, debug: bool = False):
         ])
         log_info("  Debug mode enabled (faster build, with console)")
 
+    # Nuitka already compresses the onefile payload at the highest zstd level,
+    # so the only knob worth having is turning compression off entirely
+    if compression is None:
+        compression = "fast" if debug else "max"
+    if compression == "fast":
+        cmd.append("--onefile-no-compression")
+
+    # Intermediate .build dirs are kept by default for incremental rebuilds
+    if fresh:
+        cmd.append("--remove-output")
+
     # Add the source file/directory to compile
     cmd.append(str(file_path))
 
-    # Run Nuitka
+    # Skip Nuitka entirely if nothing that affects the output has changed
+    dest_binary = DIST_DIR / output_name
+    fingerprint_file = DIST_DIR / f"{output_name}.fingerprint"
+    fingerprint = _source_fingerprint(cmd)
+    if (
+        dest_binary.exists()
+        and fingerprint_file.exists()
+        and fingerprint_file.read_text() == fingerprint
+    ):
+        log_success(f"{output_name} is up to date (cache hit), skipping build")
+        return True
+
+    # Run Nuitka. Debug builds keep the terminal for --show-progress; production
+    # output goes to build/<name>.log so parallel builds don't interleave
+    log_file = BUILD_DIR / f"{output_name}.log"
     try:
-        result = subprocess.run(cmd, cwd=PROJECT_ROOT, check=True)
+        if debug:
+            subprocess.run(cmd, cwd=PROJECT_ROOT, env=get_build_env(debug, pgo), check=True)
+        else:
+            BUILD_DIR.mkdir(exist_ok=True)
+            with log_file.open("w") as log:
+                subprocess.run(
+                    cmd,
+                    cwd=PROJECT_ROOT,
+                    env=get_build_env(debug, pgo),
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    check=True,
+                )
 
         # With --onefile, Nuitka creates: build/<output_filename>.bin (Linux)
         # The .bin extension is added automatically on Linux
@@ -173,11 +433,22 @@ def build_component(module_path: str, output_name: str, debug: bool = False):
             built_binary = BUILD_DIR / output_name
 
         if built_binary.exists():
-            # Copy single executable to dist/
-            dest_binary = DIST_DIR / output_name
-            shutil.copy2(built_binary, dest_binary)
+            if (
+                dest_binary.is_file()
+                and not dest_binary.is_symlink()
+                and filecmp.cmp(built_binary, dest_binary, shallow=False)
+            ):
+                # Byte-identical to what is already in dist/, skip the copy
+                os.utime(dest_binary)
+            else:
+                # Copy single executable to dist/ (replacing any --multiplex
+                # symlink rather than writing through it)
+                if dest_binary.is_symlink():
+                    dest_binary.unlink()
+                shutil.copy2(built_binary, dest_binary)
             # Make executable
             dest_binary.chmod(0o755)
+            fingerprint_file.write_text(fingerprint)
             log_success(f"Built {output_name} -> dist/{output_name}")
         else:
             log_warning(f"Could not find built binary at {BUILD_DIR / output_name}")
@@ -185,13 +456,29 @@ def build_component(module_path: str, output_name: str, debug: bool = False):
 
     except subprocess.CalledProcessError as e:
         log_error(f"Build failed for {output_name}: {e}")
+        if not debug and log_file.exists():
+            tail = log_file.read_text(errors="replace").splitlines()[-20:]
+            log_error(f"Last lines of {log_file}:\n" + "\n".join(tail))
         return False
 
     return True
 
 
-def build_all(debug: bool = False):
-    """Build all components."""
+def build_all(
+    debug: bool = False,
+    fresh: bool = False,
+    pgo: bool = False,
+    compression: str | None = None,
+    aggressive: bool = False,
+    multiplex: bool = False,
+):
+    """Build all components.
+
+    With multiplex, a single binary is built from glaze.multiplex and each
+    component is a symlink to it, so Nuitka analyzes the package only once.
+    It doesn't support pgo: the training run would start the binary under
+    a name the dispatcher rejects (main() refuses the combination).
+    """
     if RICH_AVAILABLE and _console:
         _console.print(Panel.fit(
             "[bold cyan]Building All Components[/bold cyan]",
@@ -206,12 +493,40 @@ def build_all(debug: bool = False):
     success_count = 0
     failed = []
 
-    for name, (module_path, output_name) in COMPONENTS.items():
-        if build_component(module_path, output_name, debug):
-            success_count += 1
+    if multiplex:
+        module_path, multiplex_name = MULTIPLEX_COMPONENT
+        if build_component(
+            module_path, multiplex_name,
+            debug, None, fresh, pgo, compression, aggressive,
+        ):
+            for _, output_name in COMPONENTS.values():
+                link = DIST_DIR / output_name
+                link.unlink(missing_ok=True)
+                (DIST_DIR / f"{output_name}.fingerprint").unlink(missing_ok=True)
+                link.symlink_to(multiplex_name)
+                success_count += 1
+            log_success(f"Linked {len(COMPONENTS)} components -> dist/{multiplex_name}")
         else:
-            failed.append(output_name)
-        print()
+            failed.extend(output_name for _, output_name in COMPONENTS.values())
+    else:
+        # Components are independent Nuitka subprocesses, so threads are enough;
+        # split the cores between them so aggregate parallelism matches the machine
+        jobs = max(1, AVAILABLE_CORES // min(len(COMPONENTS), AVAILABLE_CORES))
+
+        with ThreadPoolExecutor(max_workers=len(COMPONENTS)) as executor:
+            futures = {
+                executor.submit(
+                    build_component, module_path, output_name,
+                    debug, jobs, fresh, pgo, compression, aggressive,
+                ): output_name
+                for module_path, output_name in COMPONENTS.values()
+            }
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+                else:
+                    failed.append(futures[future])
+    print()
 
     # Build summary
     if RICH_AVAILABLE and _console:
@@ -248,7 +563,13 @@ Examples:
   python build.py --component form      # Build only login form
   python build.py --component launcher  # Build only launcher
   python build.py --debug               # Debug build (faster)
-  python build.py --clean               # Clean build artifacts
+  python build.py --pgo                 # Profile-guided optimized build
+  python build.py --compression fast    # Uncompressed onefile (faster build)
+  python build.py --aggressive          # Smaller binary, faster startup
+  python build.py --multiplex           # One shared binary for all components (not with --pgo)
+  python build.py --fresh               # Remove intermediate build files after building
+  python build.py --clean               # Clean build artifacts (keeps compiler caches)
+  python build.py --deep-clean          # Clean build artifacts and compiler caches
 
 Available components:
   - launcher    : Interactive component selector
@@ -268,38 +589,63 @@ Available components:
         action="store_true",
         help="Build in debug mode (faster, with console)"
     )
+    parser.add_argument(
+        "--pgo",
+        action="store_true",
+        help="Two-stage profile-guided optimization build (slower build, faster binaries)"
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["fast", "max"],
+        help="Onefile compression: 'fast' skips it, 'max' uses zstd "
+             "(default: fast for --debug, max otherwise)"
+    )
+    parser.add_argument(
+        "--aggressive",
+        action="store_true",
+        help="Static libpython and isolated mode (drop this flag if a component breaks)"
+    )
+    parser.add_argument(
+        "--multiplex",
+        action="store_true",
+        help="Build one shared binary and symlink each component to it (ignored with "
+             "--component; can't be combined with --pgo)"
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Remove intermediate build files after building (disables incremental reuse)"
+    )
     parser.add_argument(
         "--clean",
         action="store_true",
-        help="Clean build artifacts and exit"
+        help="Clean build artifacts and exit (keeps compiler caches)"
+    )
+    parser.add_argument(
+        "--deep-clean",
+        action="store_true",
+        help="Clean build artifacts and compiler caches, then exit"
     )
 
     args = parser.parse_args()
 
+    # The PGO training run starts the binary under its own name, which the
+    # multiplex dispatcher rejects, so it would profile only an error exit
+    if args.pgo and args.multiplex and not args.component:
+        parser.error("--pgo can't be combined with --multiplex")
+
     # Clean mode
-    if args.clean:
-        clean_build_artifacts()
+    if args.clean or args.deep_clean:
+        clean_build_artifacts(deep=args.deep_clean)
         return
 
-    # Check if nuitka is installed
-    try:
-        subprocess.run(
-            [sys.executable, "-m", "nuitka", "--version"],
-            capture_output=True,
-            check=True
-        )
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if nuitka is installed (in-process, no subprocess spawn)
+    if importlib.util.find_spec("nuitka") is None:
         log_error("Nuitka not found. Install with: pip install nuitka")
         sys.exit(1)
 
     # Check if patchelf is installed (required for standalone builds on Linux)
-    try:
-        subprocess.run(
-            ["patchelf", "--version"],
-            capture_output=True,
-            check=True
-        )
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if shutil.which("patchelf") is None:
         log_error("patchelf not found (required for standalone builds on Linux)")
         print("   Install with: sudo pacman -S patchelf  # CachyOS/Arch")
         print("   or: sudo apt install patchelf  # Debian/Ubuntu")
@@ -309,12 +655,19 @@ Available components:
     # Build specific component or all
     if args.component:
         module_path, output_name = COMPONENTS[args.component]
-        if build_component(module_path, output_name, args.debug):
+        if build_component(
+            module_path, output_name, args.debug,
+            fresh=args.fresh, pgo=args.pgo, compression=args.compression,
+            aggressive=args.aggressive,
+        ):
             log_success(f"Build complete: dist/{output_name}/{output_name}")
         else:
             sys.exit(1)
     else:
-        build_all(args.debug)
+        build_all(
+            args.debug, args.fresh, args.pgo, args.compression,
+            args.aggressive, args.multiplex,
+        )
 
 
 if __name__ == "__main__":
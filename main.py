@@ -2,6 +2,7 @@
 """Simple launcher for glaze components with Material You theme support.
 
 This file provides a quick entry point to run the interactive component launcher.
+The glaze package must be installed (e.g. `uv sync` or `pip install -e .`).
 Supports Material You theme generation from wallpaper images with multiple
 color scheme variants via matugen or fallback to Pillow extraction.
 
@@ -15,20 +16,22 @@ Usage:
 """
 import sys
 import argparse
+import functools
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from glaze.color_backend import Backend
-
-# Add src directory to Python path for development
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+if TYPE_CHECKING:
+    from glaze.color_backend import Backend
 
 
 # Short scheme names (without "scheme-" prefix) for CLI convenience
-SCHEME_CHOICES = [
+SCHEME_CHOICES = (
     "tonal-spot", "vibrant", "expressive", "rainbow",
     "fruit-salad", "fidelity", "content", "monochrome", "neutral"
-]
+)
+
+# Short scheme name -> full matugen scheme name
+_FULL_SCHEME = {short: f"scheme-{short}" for short in SCHEME_CHOICES}
 
 
 def list_schemes():
@@ -41,16 +44,17 @@ def list_schemes():
 
     print("Available Color Schemes:")
     print("-" * 40)
-    for scheme in MATUGEN_SCHEMES:
-        display = SCHEME_DISPLAY_NAMES.get(scheme, scheme)
-        # Short name for CLI
-        short = scheme.replace("scheme-", "")
-        print(f"  {short:<14} {display}")
+    # Short name for CLI next to the display name
+    print("\n".join(
+        f"  {scheme.removeprefix('scheme-'):<14} {SCHEME_DISPLAY_NAMES.get(scheme, scheme)}"
+        for scheme in MATUGEN_SCHEMES
+    ))
 
     print()
-    matugen_status = "installed" if is_matugen_available() else "not installed"
+    matugen_available = is_matugen_available()
+    matugen_status = "installed" if matugen_available else "not installed"
     print(f"Matugen status: {matugen_status}")
-    if not is_matugen_available():
+    if not matugen_available:
         print("Note: Scheme selection requires matugen. Install with:")
         print("  Arch: paru -S matugen-bin")
         print("  Cargo: cargo install matugen")
@@ -60,7 +64,7 @@ def apply_material_theme(
     image_path: str | None = None,
     color: str | None = None,
     scheme: str = "tonal-spot",
-    backend: Backend = "auto",
+    backend: "Backend" = "auto",
     light_mode: bool = False
 ) -> bool:
     """Apply Material You theme from image or color.
@@ -77,13 +81,12 @@ def apply_material_theme(
     """
     try:
         from glaze import generate_theme, SCHEME_DISPLAY_NAMES
-        import glaze
     except ImportError as e:
         print(f"Error importing glaze: {e}")
         return False
 
     # Normalize scheme name
-    full_scheme = f"scheme-{scheme}" if not scheme.startswith("scheme-") else scheme
+    full_scheme = _FULL_SCHEME.get(scheme, scheme)
 
     try:
         source = image_path or color
@@ -96,6 +99,7 @@ def apply_material_theme(
         print(f"  Backend: {backend}")
         print(f"  Mode: {'light' if light_mode else 'dark'}")
 
+        # generate_theme() installs the result via set_current_theme()
         theme, used_backend = generate_theme(
             image_path=image_path,
             color=color,
@@ -104,12 +108,6 @@ def apply_material_theme(
             backend=backend,
         )
 
-        # Update the theme in the theme module
-        import sys as sys_module
-        theme_module = sys_module.modules['glaze.theme']
-        theme_module.theme = theme # type: ignore
-        glaze.theme = theme
-
         print(f"\nTheme generated successfully using {used_backend} backend")
         print(f"  Accent: {theme.accent}")
         print(f"  Background: {theme.bg_primary}")
@@ -123,8 +121,9 @@ def apply_material_theme(
         return False
 
 
-def main():
-    """Main entry point with argument parsing."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once; it only depends on constants)."""
     parser = argparse.ArgumentParser(
         description="Glaze Launcher with Material You support",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -174,8 +173,12 @@ Examples:
         action='store_true',
         help='List available color schemes and exit'
     )
+    return parser
+
 
-    args = parser.parse_args()
+def main():
+    """Main entry point with argument parsing."""
+    args = _build_parser().parse_args()
 
     # Handle --list-schemes
     if args.list_schemes:
@@ -186,8 +189,7 @@ Examples:
     if args.wallpaper or args.color:
         # Validate wallpaper path if provided
         if args.wallpaper:
-            wallpaper_path = Path(args.wallpaper)
-            if not wallpaper_path.exists():
+            if not Path(args.wallpaper).exists():
                 print(f"Error: Wallpaper file not found: {args.wallpaper}")
                 sys.exit(1)
 
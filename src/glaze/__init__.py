@@ -20,6 +20,8 @@ Usage:
     )
 """
 
+# Theme core is imported eagerly: it is cheap, and `glaze.theme` must stay
+# bound to the Theme singleton rather than the glaze.theme submodule
 from glaze.theme import (
     Theme,
     theme,
@@ -29,36 +31,54 @@ from glaze.theme import (
     get_dialog_stylesheet,
     get_table_container_style,
 )
-from glaze.material_colors import (
-    MaterialPalette,
-    extract_dominant_color,
-    generate_material_palette,
-    palette_from_image,
-    rgb_to_hex,
-    hex_to_rgb,
-    adjust_brightness,
-    adjust_saturation,
-    set_saturation,
-    set_lightness,
-    rotate_hue,
-    blend_hue_towards_neutral,
-)
-from glaze.color_backend import (
-    generate_theme,
-    get_available_backend,
-    get_backend_info,
-    list_schemes,
-    MATUGEN_SCHEMES,
-    SCHEME_DISPLAY_NAMES,
-)
-from glaze.matugen import (
-    is_matugen_available,
-    generate_theme_from_matugen,
-)
 
-from importlib.metadata import version
+# Everything else is loaded on first access (PEP 562): name -> defining module
+_LAZY_IMPORTS = {
+    # Pillow backend (material_colors)
+    "MaterialPalette": "glaze.material_colors",
+    "extract_dominant_color": "glaze.material_colors",
+    "generate_material_palette": "glaze.material_colors",
+    "palette_from_image": "glaze.material_colors",
+    "rgb_to_hex": "glaze.material_colors",
+    "hex_to_rgb": "glaze.material_colors",
+    "adjust_brightness": "glaze.material_colors",
+    "adjust_saturation": "glaze.material_colors",
+    "set_saturation": "glaze.material_colors",
+    "set_lightness": "glaze.material_colors",
+    "rotate_hue": "glaze.material_colors",
+    "blend_hue_towards_neutral": "glaze.material_colors",
+    # Unified backend interface
+    "generate_theme": "glaze.color_backend",
+    "get_available_backend": "glaze.color_backend",
+    "get_backend_info": "glaze.color_backend",
+    "list_schemes": "glaze.color_backend",
+    "MATUGEN_SCHEMES": "glaze.color_backend",
+    "SCHEME_DISPLAY_NAMES": "glaze.color_backend",
+    # Matugen backend
+    "is_matugen_available": "glaze.matugen",
+    "generate_theme_from_matugen": "glaze.matugen",
+}
+
+
+def __getattr__(name: str):
+    """Import lazily exported names (and __version__) on first access."""
+    if name == "__version__":
+        from importlib.metadata import version
+        value = version("glaze")
+    elif name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS, "__version__"])
 
-__version__ = version("glaze")
 
 __all__ = [
     # Theme core
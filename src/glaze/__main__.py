@@ -3,6 +3,9 @@
 Run with: python -m glaze
 """
 
+import dataclasses
+import json
+import os
 import sys
 from pathlib import Path
 from PySide6.QtWidgets import (
@@ -10,62 +13,178 @@ from PySide6.QtWidgets import (
     QHBoxLayout, QVBoxLayout, QFileDialog, QButtonGroup, QRadioButton,
     QGroupBox,
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
-
-from glaze.components import (
-    LoginWindow, DataTableWindow, SettingsDialog, AwShellSettings
+from PySide6.QtCore import (
+    Qt, QTimer, QObject, QRunnable, QThreadPool, QSettings, QSize, Signal,
 )
+from PySide6.QtGui import QFont, QImage, QImageReader, QPixmap, QPixmapCache
 
 from glaze.widgets import FramelessMainWindow, ThemedComboBox
 from glaze.color_backend import (
-    generate_theme, get_backend_info,
+    generate_theme, get_available_backend, get_backend_info,
     MATUGEN_SCHEMES, SCHEME_DISPLAY_NAMES,
 )
 from glaze.matugen import is_matugen_available
+from glaze.wayland import is_system_dark_mode
+from glaze.theme import Theme, set_current_theme
 import glaze
 
+_HOME = Path.home()
+# Wallpaper published by Aw-Shell, auto-applied when present
+_AWSHELL_WALL = _HOME.resolve() / ".current.wall"
+
+# Radio button labels; the index is the QButtonGroup id
+_MODES = ("System", "Dark", "Light")
+_BACKENDS = ("Auto", "Matugen", "Pillow")
+# Backend names for generate_theme(), indexed like _BACKENDS
+_BACKEND_NAMES = ("auto", "matugen", "pillow")
+
+# Wallpaper preview size, matching the wallpaper row height
+THUMBNAIL_SIZE = 38
+# QPixmapCache limit in KiB
+THUMBNAIL_CACHE_KB = 10240
+
+
+def _decode_scaled(path: str, target: QSize) -> QImage:
+    """Decode an image once, directly at a size that fits within target.
+
+    Uses a single QImageReader: the header is read for the size, then
+    setScaledSize() lets the decoder produce the small image itself instead
+    of decoding full resolution and scaling afterwards.
+
+    Args:
+        path: Image file path
+        target: Bounding size; aspect ratio is preserved
+
+    Returns:
+        Decoded image, or a null QImage if the file can't be read
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(size.scaled(target, Qt.AspectRatioMode.KeepAspectRatio))
+    return reader.read()
+
+
+class _ThemeWorkerSignals(QObject):
+    """Signals emitted by _ThemeWorker (QRunnable can't define signals)."""
+
+    # (Theme, backend used, scheme, dark mode, settings key or None)
+    finished = Signal(object, str, str, bool, object)
+    failed = Signal(str)  # error message, empty to fail silently
+
+
+class _ThemeWorker(QRunnable):
+    """Generate a theme on a pool thread so matugen doesn't block the UI."""
+
+    def __init__(
+        self, image_path: str, scheme: str, dark_mode: bool, backend: str, key: str | None
+    ):
+        super().__init__()
+        self.image_path = image_path
+        self.scheme = scheme
+        self.dark_mode = dark_mode
+        self.backend = backend
+        self.key = key
+        self.signals = _ThemeWorkerSignals()
+
+    def run(self):
+        try:
+            theme, used_backend = generate_theme(
+                image_path=self.image_path,
+                scheme=self.scheme,
+                dark_mode=self.dark_mode,
+                backend=self.backend,
+                # The GUI thread installs it, see _on_theme_generated()
+                set_current=False,
+            )
+        except RuntimeError as e:
+            self.signals.failed.emit(str(e))
+        except AttributeError:
+            # Not reported to the user; an empty message just releases the UI
+            self.signals.failed.emit("")
+        except Exception as e:
+            self.signals.failed.emit(f"Error: {e}")
+        else:
+            self.signals.finished.emit(
+                theme, used_backend, self.scheme, self.dark_mode, self.key
+            )
+
 
 class ComponentLauncher(FramelessMainWindow):
     """Interactive launcher to select which component to run."""
 
+    # Title font, built on first use and shared by every launcher
+    _title_font: QFont | None = None
+
+    # Stat'd once per process; refreshed by refresh_awshell_wall()
+    _awshell_wall_exists = _AWSHELL_WALL.is_file()
+
+    @classmethod
+    def refresh_awshell_wall(cls) -> bool:
+        """Re-check whether the Aw-Shell wallpaper file exists."""
+        cls._awshell_wall_exists = _AWSHELL_WALL.is_file()
+        return cls._awshell_wall_exists
+
     def __init__(self):
+        QPixmapCache.setCacheLimit(THUMBNAIL_CACHE_KB)
+        self.settings = QSettings("Glaze", "Launcher")
         self.active_window = self
         super().__init__(width=500, height=860, title="Glaze Launcher")
 
-    def get_extra_stylesheet(self) -> str:
-        """Add custom styles for the theme settings group."""
-        from glaze import get_current_theme
-        t = get_current_theme()
-        return f"""
-            QGroupBox {{
-                background-color: {t.bg_secondary};
-                border: 1px solid {t.border};
+    # Color-independent rules for the theme settings group; only the small
+    # color block in get_extra_stylesheet() depends on the theme
+    _EXTRA_STATIC_STYLES = """
+            QGroupBox {
                 border-radius: 10px;
                 margin-top: 16px;
                 font-size: 13px;
-            }}
-            QGroupBox::title {{
-                color: {t.text_primary};
+            }
+            QGroupBox::title {
                 font-weight: 600;
                 font-size: 13px;
                 subcontrol-origin: margin;
                 subcontrol-position: top left;
                 padding: 0 8px;
                 left: 12px;
-            }}
-            QRadioButton {{
-                color: {t.text_primary};
+            }
+            QRadioButton {
                 spacing: 8px;
                 font-size: 13px;
                 padding: 4px 8px;
-            }}
-            QRadioButton::indicator {{
+            }
+            QRadioButton::indicator {
                 width: 18px;
                 height: 18px;
-                border: 2px solid {t.border};
                 border-radius: 10px;
                 background-color: transparent;
+            }
+    """
+
+    # Last generated extra stylesheet and the theme colors it was built from
+    _extra_styles_key: tuple[str, ...] | None = None
+    _extra_styles = ""
+
+    def get_extra_stylesheet(self) -> str:
+        """Add custom styles for the theme settings group."""
+        from glaze import get_current_theme
+        t = get_current_theme()
+        key = (t.bg_secondary, t.border, t.text_primary, t.accent)
+        if key != self._extra_styles_key:
+            self._extra_styles_key = key
+            self._extra_styles = self._EXTRA_STATIC_STYLES + f"""
+            QGroupBox {{
+                background-color: {t.bg_secondary};
+                border: 1px solid {t.border};
+            }}
+            QGroupBox::title {{
+                color: {t.text_primary};
+            }}
+            QRadioButton {{
+                color: {t.text_primary};
+            }}
+            QRadioButton::indicator {{
+                border: 2px solid {t.border};
             }}
             QRadioButton::indicator:checked {{
                 background-color: {t.accent};
@@ -75,6 +194,7 @@ class ComponentLauncher(FramelessMainWindow):
                 border-color: {t.accent};
             }}
         """
+        return self._extra_styles
 
     def setup_content(self):
         self.content_layout.setContentsMargins(40, 30, 40, 40)
@@ -82,7 +202,9 @@ class ComponentLauncher(FramelessMainWindow):
 
         # Title
         title = QLabel("Glaze Launcher")
-        title.setFont(QFont("Segoe UI", 24, QFont.Weight.Bold))
+        if ComponentLauncher._title_font is None:
+            ComponentLauncher._title_font = QFont("Segoe UI", 24, QFont.Weight.Bold)
+        title.setFont(ComponentLauncher._title_font)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.content_layout.addWidget(title)
 
@@ -105,15 +227,23 @@ class ComponentLauncher(FramelessMainWindow):
         wallpaper_label = QLabel("Wallpaper:")
         wallpaper_label.setFixedWidth(75)
         wallpaper_layout.addWidget(wallpaper_label)
+
+        self.wallpaper_preview = QLabel()
+        self.wallpaper_preview.setFixedSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE)
+        self.wallpaper_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        wallpaper_layout.addWidget(self.wallpaper_preview)
+
         self.auto_apply_theme = False
         # Aw-Shell support
-        if (Path.home() / ".current.wall").is_file():
-            self.wallpaper_path = QLineEdit(text=str(Path.home().resolve() / '.current.wall'))
+        if self._awshell_wall_exists:
+            self.wallpaper_path = QLineEdit(text=str(_AWSHELL_WALL))
             self.auto_apply_theme = True
         else:
             self.wallpaper_path = QLineEdit(placeholderText="Select wallpaper image...")
 
         self.wallpaper_path.setReadOnly(True)
+        self.wallpaper_path.textChanged.connect(self._update_wallpaper_preview)
+        self._update_wallpaper_preview(self.wallpaper_path.text())
         self.wallpaper_path.setMinimumHeight(38)
         wallpaper_layout.addWidget(self.wallpaper_path)
 
@@ -136,9 +266,10 @@ class ComponentLauncher(FramelessMainWindow):
 
         self.scheme_combo = ThemedComboBox()
         self.scheme_combo.setMinimumHeight(38)
-        for scheme in MATUGEN_SCHEMES:
-            display_name = SCHEME_DISPLAY_NAMES.get(scheme, scheme)
-            self.scheme_combo.addItem(display_name, scheme)
+        self.scheme_combo.set_items(
+            (SCHEME_DISPLAY_NAMES.get(scheme, scheme), scheme)
+            for scheme in MATUGEN_SCHEMES
+        )
         scheme_layout.addWidget(self.scheme_combo)
 
         theme_layout.addLayout(scheme_layout)
@@ -152,21 +283,9 @@ class ComponentLauncher(FramelessMainWindow):
 
         self.mode_group = QButtonGroup(self)
 
-        self.system_mode_radio = QRadioButton("System")
-        self.system_mode_radio.setMinimumHeight(32)
-        self.mode_group.addButton(self.system_mode_radio, 0)
-        mode_layout.addWidget(self.system_mode_radio)
-
-        self.dark_mode_radio = QRadioButton("Dark")
-        self.dark_mode_radio.setChecked(True)
-        self.dark_mode_radio.setMinimumHeight(32)
-        self.mode_group.addButton(self.dark_mode_radio, 1)
-        mode_layout.addWidget(self.dark_mode_radio)
-
-        self.light_mode_radio = QRadioButton("Light")
-        self.light_mode_radio.setMinimumHeight(32)
-        self.mode_group.addButton(self.light_mode_radio, 2)
-        mode_layout.addWidget(self.light_mode_radio)
+        self.system_mode_radio, self.dark_mode_radio, self.light_mode_radio = (
+            self._add_radio_group(mode_layout, self.mode_group, _MODES, checked_id=1)
+        )
 
         mode_layout.addStretch()
         theme_layout.addLayout(mode_layout)
@@ -180,21 +299,9 @@ class ComponentLauncher(FramelessMainWindow):
 
         self.backend_group = QButtonGroup(self)
 
-        self.auto_radio = QRadioButton("Auto")
-        self.auto_radio.setChecked(True)
-        self.auto_radio.setMinimumHeight(32)
-        self.backend_group.addButton(self.auto_radio, 0)
-        backend_layout.addWidget(self.auto_radio)
-
-        self.matugen_radio = QRadioButton("Matugen")
-        self.matugen_radio.setMinimumHeight(32)
-        self.backend_group.addButton(self.matugen_radio, 1)
-        backend_layout.addWidget(self.matugen_radio)
-
-        self.pillow_radio = QRadioButton("Pillow")
-        self.pillow_radio.setMinimumHeight(32)
-        self.backend_group.addButton(self.pillow_radio, 2)
-        backend_layout.addWidget(self.pillow_radio)
+        self.auto_radio, self.matugen_radio, self.pillow_radio = (
+            self._add_radio_group(backend_layout, self.backend_group, _BACKENDS, checked_id=0)
+        )
 
         backend_layout.addStretch()
         theme_layout.addLayout(backend_layout)
@@ -202,8 +309,8 @@ class ComponentLauncher(FramelessMainWindow):
         # Backend status
         backend_info = get_backend_info()
         matugen_status = "installed" if backend_info["matugen"] else "not found"
-        status_text = f"Matugen: {matugen_status}"
-        self.status_label = QLabel(status_text)
+        self._default_status = f"Matugen: {matugen_status}"
+        self.status_label = QLabel(self._default_status)
         self.status_label.setObjectName("subtitle")
         theme_layout.addWidget(self.status_label)
 
@@ -212,11 +319,11 @@ class ComponentLauncher(FramelessMainWindow):
         self._update_scheme_state()
 
         # Apply theme button
-        apply_btn = QPushButton("Apply Theme")
-        apply_btn.setMinimumHeight(42)
-        apply_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        apply_btn.clicked.connect(self.apply_theme)
-        theme_layout.addWidget(apply_btn)
+        self.apply_btn = QPushButton("Apply Theme")
+        self.apply_btn.setMinimumHeight(42)
+        self.apply_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.apply_btn.clicked.connect(self.apply_theme)
+        theme_layout.addWidget(self.apply_btn)
 
         self.content_layout.addWidget(theme_group)
 
@@ -256,20 +363,88 @@ class ComponentLauncher(FramelessMainWindow):
         info.setStyleSheet("font-size: 11px;")
         self.content_layout.addWidget(info)
 
+        self._restore_selection()
         if self.auto_apply_theme:
             self.apply_theme()
 
+    def _restore_selection(self):
+        """Restore the scheme, backend, mode and wallpaper last applied."""
+        scheme_index = self.scheme_combo.findData(
+            self.settings.value("theme/scheme", "", type=str)
+        )
+        if scheme_index >= 0:
+            self.scheme_combo.setCurrentIndex(scheme_index)
+
+        for group, key in (
+            (self.backend_group, "theme/backend_id"),
+            (self.mode_group, "theme/mode_id"),
+        ):
+            button = group.button(self.settings.value(key, -1, type=int))
+            if button:
+                button.setChecked(True)
+        self._update_scheme_state()
+
+        # The Aw-Shell wallpaper, when present, takes precedence
+        if not self.auto_apply_theme:
+            wallpaper = self.settings.value("theme/wallpaper", "", type=str)
+            if wallpaper and os.path.isfile(wallpaper):
+                self.wallpaper_path.setText(wallpaper)
+                self.auto_apply_theme = True
+
+    def _add_radio_group(
+        self,
+        layout: QHBoxLayout,
+        group: QButtonGroup,
+        labels: tuple[str, ...],
+        checked_id: int,
+    ) -> list[QRadioButton]:
+        """Create one radio button per label, using its index as the group id."""
+        buttons = []
+        for button_id, label in enumerate(labels):
+            radio = QRadioButton(label)
+            radio.setMinimumHeight(32)
+            radio.setChecked(button_id == checked_id)
+            group.addButton(radio, button_id)
+            layout.addWidget(radio)
+            buttons.append(radio)
+        return buttons
+
     def browse_wallpaper(self):
         """Open file dialog to select wallpaper image."""
+        self.refresh_awshell_wall()
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Wallpaper Image",
-            str(Path.home()),
+            str(_HOME),
             "Images (*.png *.jpg *.jpeg *.webp *.bmp);;All Files (*)"
         )
         if file_path:
             self.wallpaper_path.setText(file_path)
 
+    def _update_wallpaper_preview(self, file_path: str):
+        """Show a thumbnail of the selected wallpaper.
+
+        Thumbnails are decoded at preview size and kept in QPixmapCache,
+        keyed by path and mtime, so reselecting a wallpaper doesn't re-decode it.
+        """
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            self.wallpaper_preview.clear()
+            return
+
+        key = f"thumb:{file_path}:{mtime}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            image = _decode_scaled(file_path, QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+            if image.isNull():
+                self.wallpaper_preview.clear()
+                return
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(key, pixmap)
+
+        self.wallpaper_preview.setPixmap(pixmap)
+
     def _on_backend_changed(self):
         """Handle backend selection change."""
         self._update_scheme_state()
@@ -289,8 +464,7 @@ class ComponentLauncher(FramelessMainWindow):
 
     def _get_selected_backend(self) -> str:
         """Get the selected backend name."""
-        checked_id = self.backend_group.checkedId()
-        return ["auto", "matugen", "pillow"][checked_id]
+        return _BACKEND_NAMES[self.backend_group.checkedId()]
 
     def _get_selected_scheme(self) -> str:
         """Get the selected scheme name."""
@@ -300,44 +474,12 @@ class ComponentLauncher(FramelessMainWindow):
         """Get dark mode based on selected mode (System/Dark/Light)."""
         checked_id = self.mode_group.checkedId()
         if checked_id == 0:  # System
-            return self._detect_system_dark_mode()
+            return is_system_dark_mode()
         elif checked_id == 1:  # Dark
             return True
         else:  # Light
             return False
 
-    def _detect_system_dark_mode(self) -> bool:
-        """Detect system dark mode preference.
-
-        Checks freedesktop color-scheme setting via dbus or gsettings.
-        Falls back to dark mode if detection fails.
-        """
-        import subprocess
-        try:
-            # Try freedesktop portal (works on most modern Linux desktops)
-            result = subprocess.run(
-                ["gsettings", "get", "org.gnome.desktop.interface", "color-scheme"],
-                capture_output=True, text=True, timeout=2
-            )
-            if result.returncode == 0:
-                return "dark" in result.stdout.lower()
-        except Exception:
-            pass
-
-        try:
-            # Try GTK theme name as fallback
-            result = subprocess.run(
-                ["gsettings", "get", "org.gnome.desktop.interface", "gtk-theme"],
-                capture_output=True, text=True, timeout=2
-            )
-            if result.returncode == 0:
-                return "dark" in result.stdout.lower()
-        except Exception:
-            pass
-
-        # Default to dark mode if detection fails
-        return True
-
     def apply_theme(self):
         """Apply theme from wallpaper with selected scheme and backend."""
         wallpaper = self.wallpaper_path.text()
@@ -353,42 +495,102 @@ class ComponentLauncher(FramelessMainWindow):
         backend = self._get_selected_backend()
         scheme = self._get_selected_scheme()
         dark_mode = self._get_dark_mode()
+        key = self._theme_key(wallpaper, scheme, dark_mode, backend)
+
+        # Reuse the theme saved by the last apply with identical inputs,
+        # skipping the backend (and its matugen subprocess) entirely
+        stored = self._load_stored_theme(key)
+        if stored:
+            used_backend = self.settings.value("theme/used_backend", backend, type=str)
+            self._on_theme_generated(stored, used_backend, scheme, dark_mode, None)
+            return
 
+        # Generate off the GUI thread; matugen spawns a subprocess and
+        # decodes the image, which would otherwise freeze the window
+        # Bound slots, not lambdas: the queued call must survive the runnable
+        # (and its signals object) being deleted once run() returns
+        worker = _ThemeWorker(wallpaper, scheme, dark_mode, backend, key)
+        worker.signals.finished.connect(self._on_theme_generated)
+        worker.signals.failed.connect(self._on_theme_failed)
+        self.apply_btn.setEnabled(False)
+        self.status_label.setText("Generating theme...")
+        self.status_label.setStyleSheet("")
+        QThreadPool.globalInstance().start(worker)
+
+    def _theme_key(self, wallpaper: str, scheme: str, dark_mode: bool, backend: str) -> str | None:
+        """Identify a theme by its inputs, including the wallpaper's mtime and size.
+
+        "auto" is resolved first, so a theme made by the pillow fallback
+        isn't reused once matugen becomes available.
+        """
+        if backend == "auto":
+            backend = get_available_backend()
         try:
-            theme, used_backend = generate_theme(
-                image_path=wallpaper,
-                scheme=scheme,
-                dark_mode=dark_mode,
-                backend=backend,
-            )
-
-            # Update global theme
-            glaze.theme = theme
-
-            # Update theme module directly
-            import sys
-            theme_module = sys.modules['glaze.theme']
-            theme_module.theme = theme
-
-            # Refresh theme on this window (updates stylesheet, title bar, etc.)
-            self.refresh_theme()
-
-            # Refresh any active component windows
-            #if self.active_window and hasattr(self.active_window, 'refresh_theme'):
-            #    self.active_window.refresh_theme()
-
-            # Show success
-            mode_str = "dark" if dark_mode else "light"
-            scheme_display = SCHEME_DISPLAY_NAMES.get(scheme, scheme)
-            self._show_status(f"Theme applied: {used_backend} ({scheme_display}, {mode_str})")
-
-        except RuntimeError as e:
-            self._show_status(str(e), error=True)
-        except Exception as e:
-            if e in [AttributeError]:
-                ...
-            else:
-                self._show_status(f"Error: {e}", error=True)
+            stat = os.stat(wallpaper)
+        except OSError:
+            return None
+        return json.dumps([
+            os.path.realpath(wallpaper), stat.st_mtime_ns, stat.st_size,
+            scheme, dark_mode, backend,
+        ])
+
+    def _load_stored_theme(self, key: str | None) -> Theme | None:
+        """Return the saved theme if it was generated from the inputs in key."""
+        if key is None or self.settings.value("theme/key", "", type=str) != key:
+            return None
+        try:
+            return Theme(**json.loads(self.settings.value("theme/colors", "", type=str)))
+        except (ValueError, TypeError):
+            # Missing, corrupt, or saved by a version with different fields
+            return None
+
+    def _save_theme(self, key: str, theme: Theme, used_backend: str):
+        """Remember the applied selection and the theme it produced."""
+        self.settings.setValue("theme/wallpaper", self.wallpaper_path.text())
+        self.settings.setValue("theme/scheme", self._get_selected_scheme())
+        self.settings.setValue("theme/backend_id", self.backend_group.checkedId())
+        self.settings.setValue("theme/mode_id", self.mode_group.checkedId())
+        self.settings.setValue("theme/key", key)
+        self.settings.setValue("theme/used_backend", used_backend)
+        self.settings.setValue("theme/colors", json.dumps(dataclasses.asdict(theme)))
+
+    def _on_theme_generated(
+        self,
+        theme: Theme,
+        used_backend: str,
+        scheme: str,
+        dark_mode: bool,
+        key: str | None,
+    ):
+        """Install a generated theme; save it when key is given."""
+        self.apply_btn.setEnabled(True)
+        if key is not None:
+            self._save_theme(key, theme, used_backend)
+
+        # Update global theme on the GUI thread, both the theme module's
+        # current theme and the glaze.theme alias
+        set_current_theme(theme)
+        glaze.theme = theme
+
+        # Refresh theme on this window (updates stylesheet, title bar, etc.)
+        self.refresh_theme()
+
+        # Refresh any active component windows
+        #if self.active_window and hasattr(self.active_window, 'refresh_theme'):
+        #    self.active_window.refresh_theme()
+
+        # Show success
+        mode_str = "dark" if dark_mode else "light"
+        scheme_display = SCHEME_DISPLAY_NAMES.get(scheme, scheme)
+        self._show_status(f"Theme applied: {used_backend} ({scheme_display}, {mode_str})")
+
+    def _on_theme_failed(self, message: str):
+        """Report a theme generation error from _ThemeWorker."""
+        self.apply_btn.setEnabled(True)
+        if message:
+            self._show_status(message, error=True)
+        else:
+            self.status_label.setText(self._default_status)
 
     def _show_status(self, message: str, error: bool = False):
         """Update status label with message."""
@@ -399,12 +601,8 @@ class ComponentLauncher(FramelessMainWindow):
             self.status_label.setStyleSheet(f"color: {glaze.theme.accent};")
 
         # Reset after 3 seconds
-        from PySide6.QtCore import QTimer
-        backend_info = get_backend_info()
-        matugen_status = "installed" if backend_info["matugen"] else "not found"
-
         def reset():
-            self.status_label.setText(f"Matugen: {matugen_status}")
+            self.status_label.setText(self._default_status)
             self.status_label.setStyleSheet("")
 
         QTimer.singleShot(3000, reset)
@@ -412,23 +610,26 @@ class ComponentLauncher(FramelessMainWindow):
     def launch_login(self):
         #if self.active_window:
         #    self.active_window.close()
+        from glaze.components.form import LoginWindow
         self.active_window = LoginWindow()
         self.active_window.show()
 
     def launch_data_table(self):
         #if self.active_window:
         #    self.active_window.close()
+        from glaze.components.data_table import DataTableWindow
         self.active_window = DataTableWindow()
         self.active_window.show()
 
     def launch_settings(self):
-        pass
+        from glaze.components.settings import SettingsDialog
         dialog = SettingsDialog(self)
         dialog.exec()
 
     def launch_aw_settings(self):
         #if self.active_window:
         #    self.active_window.close()
+        from glaze.components.aw_shell import AwShellSettings
         self.active_window = AwShellSettings()
         self.active_window.show()
         
@@ -437,6 +638,9 @@ def main():
     app = QApplication(sys.argv)
     launcher = ComponentLauncher()
     launcher.show()
+    # Quit right after startup (build.py --pgo uses this as the profiling run)
+    if "--self-test" in sys.argv:
+        QTimer.singleShot(0, app.quit)
     sys.exit(app.exec())
 
 
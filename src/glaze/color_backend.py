@@ -23,6 +23,9 @@ Usage:
 
 from __future__ import annotations
 
+import functools
+import os
+import threading
 import warnings
 from typing import Literal
 
@@ -39,6 +42,11 @@ from .material_colors import palette_from_image, generate_material_palette
 # Type alias for backend selection
 Backend = Literal["auto", "matugen", "pillow"]
 
+# Serializes backend runs so concurrent identical requests (e.g. from
+# worker threads) wait for the first result and then hit the theme cache
+# instead of starting a second matugen process
+_generate_lock = threading.Lock()
+
 
 def get_available_backend() -> str:
     """Return the best available backend.
@@ -67,6 +75,7 @@ def generate_theme(
     scheme: str = "scheme-tonal-spot",
     dark_mode: bool = True,
     backend: Backend = "auto",
+    set_current: bool = True,
 ) -> tuple[Theme, str]:
     """Generate a theme from an image or color.
 
@@ -79,6 +88,8 @@ def generate_theme(
         scheme: Color scheme variant (matugen only, see MATUGEN_SCHEMES)
         dark_mode: Whether to generate dark mode theme
         backend: Backend to use - "auto", "matugen", or "pillow"
+        set_current: Install the result as the current theme. Pass False
+            when generating off the GUI thread and install it there.
 
     Returns:
         Tuple of (Theme, backend_used) where backend_used is the
@@ -128,27 +139,77 @@ def generate_theme(
             "Install with: paru -S matugen-bin or cargo install matugen"
         )
 
-    # Generate theme using selected backend
-    if actual_backend == "matugen":
-        theme = generate_theme_from_matugen(
-            image_path=image_path,
-            color=color,
-            scheme=scheme,
-            dark_mode=dark_mode,
-        )
-    else:
-        # Pillow backend
-        theme = _generate_pillow_theme(
+    # Generate theme using selected backend, reusing the result when the same
+    # unchanged image (or color) was already generated with these settings
+    with _generate_lock:
+        if image_path:
+            try:
+                resolved_path = os.path.realpath(image_path)
+                stat = os.stat(resolved_path)
+            except OSError:
+                # Let the backend report the missing/unreadable file
+                theme = _generate_backend_theme.__wrapped__(
+                    image_path, None, None, color, scheme, dark_mode, actual_backend
+                )
+            else:
+                theme = _generate_backend_theme(
+                    resolved_path, stat.st_mtime_ns, stat.st_size,
+                    None, scheme, dark_mode, actual_backend,
+                )
+        else:
+            theme = _generate_backend_theme(
+                None, None, None, color, scheme, dark_mode, actual_backend
+            )
+
+    # Update global theme so get_current_theme() returns this theme
+    if set_current:
+        set_current_theme(theme)
+
+    return theme, actual_backend
+
+
+@functools.lru_cache(maxsize=32)
+def _generate_backend_theme(
+    image_path: str | None,
+    mtime_ns: int | None,
+    size: int | None,
+    color: str | None,
+    scheme: str,
+    dark_mode: bool,
+    backend: str,
+) -> Theme:
+    """Generate a theme with a resolved backend, memoized.
+
+    The image's mtime and size are part of the cache key so an edited or
+    replaced wallpaper is regenerated. Call `_generate_backend_theme.cache_clear()`
+    to force regeneration.
+
+    Args:
+        image_path: Resolved path to wallpaper image
+        mtime_ns: Image modification time (cache key only)
+        size: Image size in bytes (cache key only)
+        color: Hex color string
+        scheme: Normalized scheme name
+        dark_mode: Whether to generate dark mode theme
+        backend: "matugen" or "pillow"
+
+    Returns:
+        Theme instance
+    """
+    if backend == "matugen":
+        return generate_theme_from_matugen(
             image_path=image_path,
             color=color,
             scheme=scheme,
             dark_mode=dark_mode,
         )
-
-    # Update global theme so get_current_theme() returns this theme
-    set_current_theme(theme)
-
-    return theme, actual_backend
+    # Pillow backend
+    return _generate_pillow_theme(
+        image_path=image_path,
+        color=color,
+        scheme=scheme,
+        dark_mode=dark_mode,
+    )
 
 
 def _generate_pillow_theme(
@@ -1,10 +1,34 @@
-"""UI components demonstrating glaze usage."""
+"""UI components demonstrating glaze usage.
 
-from glaze.components.form import LoginWindow
-from glaze.components.data_table import DataTableWindow, UserDialog
-from glaze.components.settings import SettingsDialog
+Components are imported on first access (PEP 562), so importing one
+component doesn't pull in the widgets of all the others.
+"""
+
+# Exported name -> defining module
+_LAZY_IMPORTS = {
+    "LoginWindow": "glaze.components.form",
+    "DataTableWindow": "glaze.components.data_table",
+    "UserDialog": "glaze.components.data_table",
+    "SettingsDialog": "glaze.components.settings",
+    "AwShellSettings": "glaze.components.aw_shell",
+}
+
+
+def __getattr__(name: str):
+    """Import components on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS])
 
-from glaze.components.aw_shell import AwShellSettings
 
 __all__ = [
     "LoginWindow",
@@ -8,20 +8,20 @@ Desktop shell configuration panel with:
 - About (links, credits)
 """
 
+import functools
 import os
 import sys
-import webbrowser
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSignalBlocker, QTimer
 from PySide6.QtWidgets import (
     QApplication, QCheckBox, QFileDialog, QFormLayout, QFrame,
     QGraphicsDropShadowEffect, QGridLayout, QGroupBox, QHBoxLayout,
     QLabel, QLineEdit, QMessageBox, QPushButton, QScrollArea,
     QSizePolicy, QSlider,  QTabWidget, QVBoxLayout, QWidget
 )
-from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtGui import QColor, QImageReader, QPixmap, QShowEvent
 
 from glaze.theme import get_dialog_stylesheet, get_table_container_style, get_current_theme
 from glaze.widgets import ThemedComboBox, FramelessMainWindow, DonateButton
@@ -36,6 +36,23 @@ PANEL_POSITIONS = ["Start", "Center", "End"]
 NOTIFICATION_POSITIONS = ["Top", "Bottom"]
 METRIC_NAMES = {"cpu": "CPU", "ram": "RAM", "disk": "Disk", "gpu": "GPU"}
 
+WINDOW_MIN_WIDTH = 400
+WINDOW_MIN_HEIGHT = 380
+# Smallest size a staged face icon is decoded at before cropping
+FACE_ICON_MIN_SIZE = 512
+
+# Combined alignment flags, built once instead of per widget
+ALIGN_LEFT_VCENTER = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+# Scroll area settings for tab pages
+SCROLLBAR_OFF = Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+SCROLLBAR_AS_NEEDED = Qt.ScrollBarPolicy.ScrollBarAsNeeded
+NO_FRAME = QFrame.Shape.NoFrame
+
+# Shared size policy for every SettingsSection (QWidget copies it)
+SECTION_SIZE_POLICY = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+
 COMPONENT_DISPLAY_NAMES = {
     "button_apps": "App Launcher Button",
     "systray": "System Tray",
@@ -53,6 +70,14 @@ COMPONENT_DISPLAY_NAMES = {
     "button_power": "Power Button",
 }
 
+# (name, display name, row, column) for the 2-column component toggle grid,
+# filled column by column
+_COMPONENT_ROWS = (len(COMPONENT_DISPLAY_NAMES) + 1) // 2
+COMPONENT_GRID = tuple(
+    (name, display, idx % _COMPONENT_ROWS, idx // _COMPONENT_ROWS)
+    for idx, (name, display) in enumerate(COMPONENT_DISPLAY_NAMES.items())
+)
+
 KEYBIND_SECTIONS: List[Tuple[str, List[Tuple[str, str, str]]]] = [
     ("Shell Controls", [
         (f"Reload {APP_NAME_CAP}", "prefix_restart", "suffix_restart"),
@@ -83,11 +108,105 @@ KEYBIND_SECTIONS: List[Tuple[str, List[Tuple[str, str, str]]]] = [
 ]
 
 
+@functools.lru_cache(maxsize=4)
+def _compose_extra_qss(text_primary: str, surface_variant: str, accent: str) -> str:
+    """Build the settings window's extra QSS for one set of theme colors."""
+    return f"""
+        QScrollArea {{
+            border: none;
+            background: transparent;
+        }}
+        QScrollArea > QWidget > QWidget {{
+            background: transparent;
+        }}
+        SettingsSection {{
+            font-weight: 600;
+            padding: 12px 8px 8px 8px;
+            margin-top: 4px;
+        }}
+        SettingsSection > QWidget {{
+            margin-left: 4px;
+        }}
+        SettingsSection::title {{
+            subcontrol-origin: margin;
+            subcontrol-position: top left;
+            padding: 2px 6px;
+            color: {text_primary};
+        }}
+        QSlider::groove:horizontal {{
+            height: 4px;
+            background: {surface_variant};
+            border-radius: 2px;
+        }}
+        QSlider::handle:horizontal {{
+            background: {accent};
+            width: 14px;
+            height: 14px;
+            margin: -5px 0;
+            border-radius: 7px;
+        }}
+        QSlider::sub-page:horizontal {{
+            background: {accent};
+            border-radius: 2px;
+        }}
+        QLineEdit {{
+            padding: 4px 8px;
+            min-height: 24px;
+        }}
+        QCheckBox {{
+            spacing: 6px;
+        }}
+        QCheckBox::indicator {{
+            width: 16px;
+            height: 16px;
+        }}
+        QLabel {{
+            padding: 0px;
+        }}
+        QLabel#faceIcon {{
+            border: 1px solid rgba(255, 255, 255, 0.2);
+            border-radius: 4px;
+        }}
+        QLabel#metricsHeader {{
+            font-weight: 600;
+        }}
+    """
+
+
+def _load_face_pixmap(path: str, size: int = 64) -> QPixmap:
+    """Load an avatar decoded directly at preview size, keeping aspect ratio."""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    image_size = reader.size()
+    if image_size.isValid():
+        reader.setScaledSize(image_size.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio))
+        return QPixmap.fromImage(reader.read())
+    # Format can't report its size up front; a fast scale is enough for the thumbnail
+    pixmap = QPixmap.fromImage(reader.read())
+    if pixmap.isNull():
+        return pixmap
+    return pixmap.scaled(
+        size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation
+    )
+
+
+def _keybind_entry(text: str, placeholder: str, max_width: int) -> QLineEdit:
+    """Create a key binding line edit.
+
+    The height comes from the shared QLineEdit rule in _compose_extra_qss
+    (min-height plus padding), which already overrides setMinimumHeight().
+    """
+    entry = QLineEdit(text)
+    entry.setPlaceholderText(placeholder)
+    entry.setMaximumWidth(max_width)
+    return entry
+
+
 class SettingsSection(QGroupBox):
     """Styled section group box."""
     def __init__(self, title: str, parent=None):
         super().__init__(title, parent)
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self.setSizePolicy(SECTION_SIZE_POLICY)
 
 
 class AwShellSettings(FramelessMainWindow):
@@ -95,11 +214,9 @@ class AwShellSettings(FramelessMainWindow):
 
     def __init__(self, parent=None):
         self.bridge = get_bridge()
-        path = Path(".")
-        path.exists()
         # Check for hyprlock/hypridle source files
-        self.show_lock_checkbox = Path(f"~/.config/{APP_NAME}/config/hypr/hyprlock.conf").exists()
-        self.show_idle_checkbox = Path(f"~/.config/{APP_NAME}/config/hypr/hypridle.conf").exists()
+        self.show_lock_checkbox = Path(f"~/.config/{APP_NAME}/config/hypr/hyprlock.conf").expanduser().is_file()
+        self.show_idle_checkbox = Path(f"~/.config/{APP_NAME}/config/hypr/hypridle.conf").expanduser().is_file()
 
         # Widget references
         self.keybind_entries: List[Tuple[str, str, QLineEdit, QLineEdit]] = []
@@ -107,20 +224,31 @@ class AwShellSettings(FramelessMainWindow):
         self.metrics_switches: Dict[str, QCheckBox] = {}
         self.metrics_small_switches: Dict[str, QCheckBox] = {}
         self.monitor_checkboxes: Dict[str, QCheckBox] = {}
-        self.disk_entries: List[QWidget] = []
+        self.disk_entries: Dict[QWidget, QLineEdit] = {}  # row container -> path entry
         self.selected_face_icon: Optional[str] = None
+        # Only created when the matching Aw-Shell config exists
+        self.lock_cb: Optional[QCheckBox] = None
+        self.idle_cb: Optional[QCheckBox] = None
 
         super().__init__(width=560, height=1080, title=f"{APP_NAME_CAP} Settings")
-        self.setMinimumSize(400, 380)
+        self.setMinimumSize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
+
+    def _create_scrollable_tab(self, content: QWidget) -> QWidget:
+        """Wrap tab content in a scroll area, unless it fits without one.
+
+        Content no taller than the window's minimum height is returned as is,
+        saving the scroll area and its viewport; the layout then keeps the
+        window from shrinking below it, so nothing is clipped.
+        """
+        if content.sizeHint().height() <= WINDOW_MIN_HEIGHT:
+            return content
 
-    def _create_scrollable_tab(self, content: QWidget) -> QScrollArea:
-        """Wrap tab content in a scroll area."""
         scroll = QScrollArea()
         scroll.setWidget(content)
         scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll.setFrameShape(QFrame.Shape.NoFrame)
+        scroll.setHorizontalScrollBarPolicy(SCROLLBAR_OFF)
+        scroll.setVerticalScrollBarPolicy(SCROLLBAR_AS_NEEDED)
+        scroll.setFrameShape(NO_FRAME)
         return scroll
 
     def setup_content(self):
@@ -132,13 +260,8 @@ class AwShellSettings(FramelessMainWindow):
         tab_container.setObjectName("tableContainer")
         tab_container.setStyleSheet(get_table_container_style())
         tab_container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(2)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        tab_container.setGraphicsEffect(shadow)
+        # Shadow is attached after the first show, see showEvent()
+        self._tab_container = tab_container
 
         container_layout = QVBoxLayout(tab_container)
         container_layout.setContentsMargins(0, 0, 0, 0)
@@ -149,11 +272,23 @@ class AwShellSettings(FramelessMainWindow):
         self.tabs.setObjectName("settingsTabs")
         self.tabs.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
-        # Build tabs matching original structure
-        self.tabs.addTab(self._create_scrollable_tab(self._build_keybindings_tab()), "Key Bindings")
-        self.tabs.addTab(self._create_scrollable_tab(self._build_appearance_tab()), "Appearance")
-        self.tabs.addTab(self._create_scrollable_tab(self._build_system_tab()), "System")
-        self.tabs.addTab(self._build_about_tab(), "About")
+        # Tabs matching original structure: (name, builder, scrollable).
+        # Only the first tab is built up front; the rest are built the first
+        # time they are shown, into an empty placeholder page.
+        self._tab_builders = [
+            ("Key Bindings", self._build_keybindings_tab, True),
+            ("Appearance", self._build_appearance_tab, True),
+            ("System", self._build_system_tab, True),
+            ("About", self._build_about_tab, False),
+        ]
+        self._built_tabs: set[str] = set()
+        for name, _, _ in self._tab_builders:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(page, name)
+        self._ensure_tab_built(0)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
 
         container_layout.addWidget(self.tabs)
         self.content_layout.addWidget(tab_container, 1)
@@ -181,62 +316,52 @@ class AwShellSettings(FramelessMainWindow):
 
         self.content_layout.addLayout(row)
 
+    def showEvent(self, event: QShowEvent):
+        """Attach the tab container shadow once the window is on screen."""
+        super().showEvent(event)
+        if self._tab_container.graphicsEffect() is None:
+            QTimer.singleShot(0, self._install_shadow)
+
+    def _install_shadow(self) -> None:
+        """Add the drop shadow, unless disabled with GLAZE_NO_SHADOWS.
+
+        The effect renders the container offscreen and re-blurs it on every
+        repaint, so it's kept out of the first paint.
+        """
+        if os.environ.get("GLAZE_NO_SHADOWS") or self._tab_container.graphicsEffect():
+            return
+        shadow = QGraphicsDropShadowEffect(self._tab_container)
+        shadow.setBlurRadius(15)
+        shadow.setXOffset(0)
+        shadow.setYOffset(2)
+        shadow.setColor(QColor(0, 0, 0, 80))
+        self._tab_container.setGraphicsEffect(shadow)
+
+    def _ensure_tab_built(self, index: int) -> None:
+        """Build a tab's content into its placeholder page on first use."""
+        if not 0 <= index < len(self._tab_builders):
+            return
+        name, builder, scrollable = self._tab_builders[index]
+        if name in self._built_tabs:
+            return
+        self._built_tabs.add(name)
+
+        # Builders populate a parentless widget, so only the final addWidget()
+        # touches the visible page; hold its repaints until that is laid out
+        page = self.tabs.widget(index)
+        page.setUpdatesEnabled(False)
+        try:
+            content = builder()
+            if scrollable:
+                content = self._create_scrollable_tab(content)
+            page.layout().addWidget(content)  # pyright: ignore[reportOptionalMemberAccess]
+        finally:
+            page.setUpdatesEnabled(True)
+
     def get_extra_stylesheet(self) -> str:
         """Return dialog-specific styles."""
         t = get_current_theme()
-        return get_dialog_stylesheet() + f"""
-            QScrollArea {{
-                border: none;
-                background: transparent;
-            }}
-            QScrollArea > QWidget > QWidget {{
-                background: transparent;
-            }}
-            SettingsSection {{
-                font-weight: 600;
-                padding: 12px 8px 8px 8px;
-                margin-top: 4px;
-            }}
-            SettingsSection > QWidget {{
-                margin-left: 4px;
-            }}
-            SettingsSection::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 2px 6px;
-                color: {t.text_primary};
-            }}
-            QSlider::groove:horizontal {{
-                height: 4px;
-                background: {t.surface_variant};
-                border-radius: 2px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {t.accent};
-                width: 14px;
-                height: 14px;
-                margin: -5px 0;
-                border-radius: 7px;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {t.accent};
-                border-radius: 2px;
-            }}
-            QLineEdit {{
-                padding: 4px 8px;
-                min-height: 24px;
-            }}
-            QCheckBox {{
-                spacing: 6px;
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-            }}
-            QLabel {{
-                padding: 0px;
-            }}
-        """
+        return get_dialog_stylesheet() + _compose_extra_qss(t.text_primary, t.surface_variant, t.accent)
 
     # =========================================================================
     # KEY BINDINGS TAB
@@ -248,6 +373,7 @@ class AwShellSettings(FramelessMainWindow):
         layout.setSpacing(16)
         layout.setContentsMargins(16, 16, 16, 16)
 
+        get = self.bridge.get  # bound once for the ~40 lookups below
         for section_name, bindings in KEYBIND_SECTIONS:
             section = SettingsSection(section_name)
             section_layout = QVBoxLayout(section)
@@ -262,25 +388,17 @@ class AwShellSettings(FramelessMainWindow):
             for row, (label_text, prefix_key, suffix_key) in enumerate(bindings):
                 action_lbl = QLabel(label_text)
                 action_lbl.setFixedWidth(140)
-                grid.addWidget(action_lbl, row, 0, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+                grid.addWidget(action_lbl, row, 0, ALIGN_LEFT_VCENTER)
 
-                prefix_entry = QLineEdit()
-                prefix_entry.setText(str(self.bridge.get(prefix_key, "")))
-                prefix_entry.setPlaceholderText("SUPER ...")
-                prefix_entry.setMinimumHeight(32)
-                prefix_entry.setMaximumWidth(130)
+                prefix_entry = _keybind_entry(str(get(prefix_key, "")), "SUPER ...", 130)
                 grid.addWidget(prefix_entry, row, 1)
 
                 plus_lbl = QLabel("+")
-                plus_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                plus_lbl.setAlignment(ALIGN_CENTER)
                 plus_lbl.setFixedWidth(12)
                 grid.addWidget(plus_lbl, row, 2)
 
-                suffix_entry = QLineEdit()
-                suffix_entry.setText(str(self.bridge.get(suffix_key, "")))
-                suffix_entry.setPlaceholderText("Key")
-                suffix_entry.setMinimumHeight(32)
-                suffix_entry.setMaximumWidth(80)
+                suffix_entry = _keybind_entry(str(get(suffix_key, "")), "Key", 80)
                 grid.addWidget(suffix_entry, row, 3)
 
                 self.keybind_entries.append((prefix_key, suffix_key, prefix_entry, suffix_entry))
@@ -321,7 +439,7 @@ class AwShellSettings(FramelessMainWindow):
         form = QFormLayout(section)
         form.setSpacing(12)
         form.setHorizontalSpacing(16)
-        form.setLabelAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        form.setLabelAlignment(ALIGN_LEFT_VCENTER)
 
         # Wallpaper directory
         dir_row = QHBoxLayout()
@@ -343,7 +461,7 @@ class AwShellSettings(FramelessMainWindow):
         icon_row = QHBoxLayout()
         self.face_image = QLabel()
         self.face_image.setFixedSize(64, 64)
-        self.face_image.setStyleSheet("border: 1px solid rgba(255,255,255,0.2); border-radius: 4px;")
+        self.face_image.setObjectName("faceIcon")
         self._load_face_icon()
         icon_row.addWidget(self.face_image)
 
@@ -363,10 +481,9 @@ class AwShellSettings(FramelessMainWindow):
         layout.addWidget(section)
 
     def _load_face_icon(self) -> None:
-        face_path = Path("~/.face.icon").exists()
-        if face_path:
-            pixmap = QPixmap(str(face_path)).scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.face_image.setPixmap(pixmap)
+        face_path = Path("~/.face.icon").expanduser()
+        if face_path.is_file():
+            self.face_image.setPixmap(_load_face_pixmap(str(face_path)))
         else:
             self.face_image.setText("No Icon")
             self.face_image.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -384,8 +501,7 @@ class AwShellSettings(FramelessMainWindow):
         if path:
             self.selected_face_icon = path
             self.face_status_label.setText(f"Selected: {os.path.basename(path)}")
-            pixmap = QPixmap(path).scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.face_image.setPixmap(pixmap)
+            self.face_image.setPixmap(_load_face_pixmap(path))
 
     def _build_datetime_section(self, layout: QVBoxLayout) -> None:
         section = SettingsSection("Date && Time")
@@ -400,126 +516,105 @@ class AwShellSettings(FramelessMainWindow):
 
     def _build_layout_section(self, layout: QVBoxLayout) -> None:
         section = SettingsSection("Layout")
-        section_layout = QVBoxLayout(section)
-        section_layout.setSpacing(12)
+        # One grid for the whole section: labels in column 0, main controls in
+        # column 1, the panel position pair in columns 2-3, column 4 absorbs
+        # extra width and column 5 holds the dock size readout
+        grid = QGridLayout(section)
+        grid.setHorizontalSpacing(10)
+        grid.setVerticalSpacing(12)
+        grid.setColumnMinimumWidth(0, 120)
+        grid.setColumnStretch(4, 1)
 
         # Bar Position row
-        pos_row = QHBoxLayout()
-        pos_row.setSpacing(10)
-        pos_label = QLabel("Bar Position:")
-        pos_label.setFixedWidth(120)
-        pos_row.addWidget(pos_label, 0, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        grid.addWidget(QLabel("Bar Position:"), 0, 0, ALIGN_LEFT_VCENTER)
         self.position_combo = ThemedComboBox()
         self.position_combo.addItems(POSITIONS)
         self.position_combo.setCurrentText(str(self.bridge.get("bar_position", "Top")))
         self.position_combo.setMinimumWidth(120)
         self.position_combo.currentTextChanged.connect(self._on_position_changed)
-        pos_row.addWidget(self.position_combo)
-        pos_row.addStretch()
-        section_layout.addLayout(pos_row)
+        grid.addWidget(self.position_combo, 0, 1)
 
-        # Checkboxes in compact rows
         self.centered_cb = QCheckBox("Centered Bar (Left/Right only)")
         self.centered_cb.setChecked(self.bridge.get("centered_bar", False))
         self.centered_cb.setEnabled(self.bridge.get("bar_position") in ["Left", "Right"])
-        section_layout.addWidget(self.centered_cb)
+        grid.addWidget(self.centered_cb, 1, 0, 1, -1)
 
         # Dock settings
-        dock_row = QHBoxLayout()
-        dock_row.setSpacing(20)
         self.dock_cb = QCheckBox("Show Dock")
         self.dock_cb.setChecked(self.bridge.get("dock_enabled", True))
         self.dock_cb.stateChanged.connect(self._on_dock_changed)
-        dock_row.addWidget(self.dock_cb)
+        grid.addWidget(self.dock_cb, 2, 0)
         self.dock_always_cb = QCheckBox("Always Show Dock")
         self.dock_always_cb.setChecked(self.bridge.get("dock_always_show", False))
         self.dock_always_cb.setEnabled(self.dock_cb.isChecked())
-        dock_row.addWidget(self.dock_always_cb)
-        dock_row.addStretch()
-        section_layout.addLayout(dock_row)
+        grid.addWidget(self.dock_always_cb, 2, 1, 1, -1)
 
         # Dock icon size
-        size_row = QHBoxLayout()
-        size_row.setSpacing(12)
-        size_label = QLabel("Dock Icon Size:")
-        size_label.setFixedWidth(120)
-        size_row.addWidget(size_label, 0, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        grid.addWidget(QLabel("Dock Icon Size:"), 3, 0, ALIGN_LEFT_VCENTER)
         self.dock_size_slider = QSlider(Qt.Orientation.Horizontal)
         self.dock_size_slider.setRange(16, 48)
         self.dock_size_slider.setValue(int(self.bridge.get("dock_icon_size", 28)))
         self.dock_size_slider.setMinimumWidth(200)
-        size_row.addWidget(self.dock_size_slider, 1)
+        grid.addWidget(self.dock_size_slider, 3, 1, 1, 4)
         self.dock_size_label = QLabel(str(self.dock_size_slider.value()))
         self.dock_size_label.setMinimumWidth(30)
         self.dock_size_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self.dock_size_slider.valueChanged.connect(lambda v: self.dock_size_label.setText(str(v)))
-        size_row.addWidget(self.dock_size_label)
-        section_layout.addLayout(size_row)
+        # Native QLabel slot: slider drags update the readout without a Python call
+        self.dock_size_slider.valueChanged.connect(self.dock_size_label.setNum)
+        grid.addWidget(self.dock_size_label, 3, 5)
 
         # Workspace options
-        ws_row = QHBoxLayout()
-        ws_row.setSpacing(20)
         self.ws_num_cb = QCheckBox("Show Workspace Numbers")
         self.ws_num_cb.setChecked(self.bridge.get("bar_workspace_show_number", False))
         self.ws_num_cb.stateChanged.connect(self._on_ws_num_changed)
-        ws_row.addWidget(self.ws_num_cb)
+        grid.addWidget(self.ws_num_cb, 4, 0, 1, 2)
         self.ws_runes_cb = QCheckBox("Use Runes  ᚠ ᚢ ᚦ ᚯ ᚱ …")
         self.ws_runes_cb.setChecked(self.bridge.get("bar_workspace_use_runes", False))
         self.ws_runes_cb.setEnabled(self.ws_num_cb.isChecked())
-        ws_row.addWidget(self.ws_runes_cb)
-        ws_row.addStretch()
-        section_layout.addLayout(ws_row)
+        grid.addWidget(self.ws_runes_cb, 4, 2, 1, -1)
 
         self.special_ws_cb = QCheckBox("Hide Special Workspace")
         self.special_ws_cb.setChecked(self.bridge.get("bar_hide_special_workspace", True))
-        section_layout.addWidget(self.special_ws_cb)
-
-        # Theme combos using form-style rows
-        theme_form = QFormLayout()
-        theme_form.setSpacing(12)
-        theme_form.setHorizontalSpacing(16)
-        theme_form.setLabelAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        grid.addWidget(self.special_ws_cb, 5, 0, 1, -1)
 
+        # Theme combos
+        grid.addWidget(QLabel("Bar Theme:"), 6, 0, ALIGN_LEFT_VCENTER)
         self.bar_theme_combo = ThemedComboBox()
         self.bar_theme_combo.addItems(THEMES)
         self.bar_theme_combo.setCurrentText(str(self.bridge.get("bar_theme", "Pills")))
         self.bar_theme_combo.setMinimumWidth(150)
-        theme_form.addRow("Bar Theme:", self.bar_theme_combo)
+        grid.addWidget(self.bar_theme_combo, 6, 1)
 
+        grid.addWidget(QLabel("Dock Theme:"), 7, 0, ALIGN_LEFT_VCENTER)
         self.dock_theme_combo = ThemedComboBox()
         self.dock_theme_combo.addItems(THEMES)
         self.dock_theme_combo.setCurrentText(str(self.bridge.get("dock_theme", "Pills")))
         self.dock_theme_combo.setMinimumWidth(150)
-        theme_form.addRow("Dock Theme:", self.dock_theme_combo)
+        grid.addWidget(self.dock_theme_combo, 7, 1)
 
         # Panel theme + position on same row
-        panel_row = QHBoxLayout()
-        panel_row.setSpacing(10)
+        grid.addWidget(QLabel("Panel Theme:"), 8, 0, ALIGN_LEFT_VCENTER)
         self.panel_theme_combo = ThemedComboBox()
         self.panel_theme_combo.addItems(PANEL_THEMES)
         self.panel_theme_combo.setCurrentText(str(self.bridge.get("panel_theme", "Notch")))
         self.panel_theme_combo.setMinimumWidth(150)
         self.panel_theme_combo.currentTextChanged.connect(self._on_panel_theme_changed)
-        panel_row.addWidget(self.panel_theme_combo)
+        grid.addWidget(self.panel_theme_combo, 8, 1)
 
-        panel_pos_label = QLabel("Position:")
-        panel_row.addWidget(panel_pos_label)
+        grid.addWidget(QLabel("Position:"), 8, 2, ALIGN_LEFT_VCENTER)
         self.panel_position_combo = ThemedComboBox()
         self.panel_position_combo.addItems(PANEL_POSITIONS)
         self.panel_position_combo.setCurrentText(str(self.bridge.get("panel_position", "Center")))
         self.panel_position_combo.setEnabled(self.panel_theme_combo.currentText() == "Panel")
         self.panel_position_combo.setMinimumWidth(100)
-        panel_row.addWidget(self.panel_position_combo)
-        panel_row.addStretch()
-        theme_form.addRow("Panel Theme:", panel_row)
+        grid.addWidget(self.panel_position_combo, 8, 3)
 
+        grid.addWidget(QLabel("Notifications:"), 9, 0, ALIGN_LEFT_VCENTER)
         self.notif_pos_combo = ThemedComboBox()
         self.notif_pos_combo.addItems(NOTIFICATION_POSITIONS)
         self.notif_pos_combo.setCurrentText(str(self.bridge.get("notif_pos", "Top")))
         self.notif_pos_combo.setMinimumWidth(150)
-        theme_form.addRow("Notifications:", self.notif_pos_combo)
-
-        section_layout.addLayout(theme_form)
+        grid.addWidget(self.notif_pos_combo, 9, 1)
 
         layout.addWidget(section)
 
@@ -558,19 +653,12 @@ class AwShellSettings(FramelessMainWindow):
         grid.setHorizontalSpacing(20)
         grid.setVerticalSpacing(6)
 
-        items = list(COMPONENT_DISPLAY_NAMES.items())
-        rows_per_col = (len(items) + 1) // 2
-
-        for idx, (name, display) in enumerate(items):
-            if idx < rows_per_col:
-                row = idx
-                col = 0
-            else:
-                row = idx - rows_per_col
-                col = 1
-
+        get = self.bridge.get
+        for name, display, row, col in COMPONENT_GRID:
             cb = QCheckBox(display)
-            cb.setChecked(self.bridge.get(f"bar_{name}_visible", True))
+            # New checkboxes start unchecked, so only the checked state needs setting
+            if get(f"bar_{name}_visible", True):
+                cb.setChecked(True)
             grid.addWidget(cb, row, col)
             self.component_switches[name] = cb
 
@@ -634,8 +722,8 @@ class AwShellSettings(FramelessMainWindow):
         for mon in monitors:
             name = mon.get("name", f'monitor-{mon.get("id", 0)}')
             cb = QCheckBox(name)
-            is_selected = len(current_selection) == 0 or name in current_selection
-            cb.setChecked(is_selected)
+            if not current_selection or name in current_selection:
+                cb.setChecked(True)
             section_layout.addWidget(cb)
             self.monitor_checkboxes[name] = cb
 
@@ -651,7 +739,7 @@ class AwShellSettings(FramelessMainWindow):
         form = QFormLayout(section)
         form.setSpacing(12)
         form.setHorizontalSpacing(16)
-        form.setLabelAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        form.setLabelAlignment(ALIGN_LEFT_VCENTER)
 
         self.terminal_entry = QLineEdit()
         self.terminal_entry.setText(str(self.bridge.get("terminal_command", "kitty -e")))
@@ -696,7 +784,7 @@ class AwShellSettings(FramelessMainWindow):
         form = QFormLayout(section)
         form.setSpacing(12)
         form.setHorizontalSpacing(16)
-        form.setLabelAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        form.setLabelAlignment(ALIGN_LEFT_VCENTER)
 
         self.limited_apps_entry = QLineEdit()
         limited_list = self.bridge.get("limited_apps_history", [])
@@ -730,10 +818,10 @@ class AwShellSettings(FramelessMainWindow):
 
         # Column headers
         metrics_header = QLabel("Metrics")
-        metrics_header.setStyleSheet("font-weight: 600;")
+        metrics_header.setObjectName("metricsHeader")
         grid.addWidget(metrics_header, 0, 0)
         small_header = QLabel("Small Metrics")
-        small_header.setStyleSheet("font-weight: 600;")
+        small_header.setObjectName("metricsHeader")
         grid.addWidget(small_header, 0, 1)
 
         metrics_vis = self.bridge.get("metrics_visible", {})
@@ -741,12 +829,14 @@ class AwShellSettings(FramelessMainWindow):
 
         for i, (key, label) in enumerate(METRIC_NAMES.items()):
             cb = QCheckBox(label)
-            cb.setChecked(metrics_vis.get(key, True))
+            if metrics_vis.get(key, True):
+                cb.setChecked(True)
             grid.addWidget(cb, i + 1, 0)
             self.metrics_switches[key] = cb
 
             cb_small = QCheckBox(label)
-            cb_small.setChecked(metrics_small_vis.get(key, True))
+            if metrics_small_vis.get(key, True):
+                cb_small.setChecked(True)
             grid.addWidget(cb_small, i + 1, 1)
             self.metrics_small_switches[key] = cb_small
 
@@ -790,11 +880,10 @@ class AwShellSettings(FramelessMainWindow):
         row.addWidget(remove_btn)
 
         self.disk_container.addWidget(container)
-        self.disk_entries.append(container)
+        self.disk_entries[container] = entry
 
     def _remove_disk_entry(self, widget: QWidget) -> None:
-        if widget in self.disk_entries:
-            self.disk_entries.remove(widget)
+        if self.disk_entries.pop(widget, None) is not None:
             widget.deleteLater()
 
     # =========================================================================
@@ -858,64 +947,73 @@ class AwShellSettings(FramelessMainWindow):
     # =========================================================================
 
     def _collect_settings(self) -> dict:
-        """Collect all settings from widgets."""
-        settings = {}
+        """Collect all settings from widgets.
+
+        Tabs that were never opened have no widgets; their settings keep
+        the bridge's current values.
+        """
+        settings = self.bridge.get_all()
 
         # Keybindings
-        for prefix_key, suffix_key, prefix_entry, suffix_entry in self.keybind_entries:
-            settings[prefix_key] = prefix_entry.text()
-            settings[suffix_key] = suffix_entry.text()
-
-        # Appearance
-        settings["wallpapers_dir"] = self.wall_dir_entry.text()
-        settings["datetime_12h_format"] = self.datetime_12h_cb.isChecked()
-        settings["bar_position"] = self.position_combo.currentText()
-        settings["vertical"] = settings["bar_position"] in ["Left", "Right"]
-        settings["centered_bar"] = self.centered_cb.isChecked()
-        settings["dock_enabled"] = self.dock_cb.isChecked()
-        settings["dock_always_show"] = self.dock_always_cb.isChecked()
-        settings["dock_icon_size"] = self.dock_size_slider.value()
-        settings["bar_workspace_show_number"] = self.ws_num_cb.isChecked()
-        settings["bar_workspace_use_runes"] = self.ws_runes_cb.isChecked()
-        settings["bar_hide_special_workspace"] = self.special_ws_cb.isChecked()
-        settings["bar_theme"] = self.bar_theme_combo.currentText()
-        settings["dock_theme"] = self.dock_theme_combo.currentText()
-        settings["panel_theme"] = self.panel_theme_combo.currentText()
-        settings["panel_position"] = self.panel_position_combo.currentText()
-        settings["notif_pos"] = self.notif_pos_combo.currentText()
-        settings["corners_visible"] = self.corners_cb.isChecked()
+        settings.update(
+            item
+            for prefix_key, suffix_key, prefix_entry, suffix_entry in self.keybind_entries
+            for item in ((prefix_key, prefix_entry.text()), (suffix_key, suffix_entry.text()))
+        )
 
-        # Component visibility
-        for name, cb in self.component_switches.items():
-            settings[f"bar_{name}_visible"] = cb.isChecked()
+        if "Appearance" in self._built_tabs:
+            self._collect_appearance_settings(settings)
+        if "System" in self._built_tabs:
+            self._collect_system_settings(settings)
 
-        # System
-        settings["auto_append_hyprland"] = self.auto_append_cb.isChecked()
-        settings["terminal_command"] = self.terminal_entry.text()
+        return settings
 
-        # Monitors
-        selected_monitors = [name for name, cb in self.monitor_checkboxes.items() if cb.isChecked()]
-        settings["selected_monitors"] = selected_monitors if any(cb.isChecked() for cb in self.monitor_checkboxes.values()) else []
+    def _collect_appearance_settings(self, settings: dict) -> None:
+        """Collect Appearance tab settings into settings."""
+        bar_position = self.position_combo.currentText()
+        settings.update({
+            "wallpapers_dir": self.wall_dir_entry.text(),
+            "datetime_12h_format": self.datetime_12h_cb.isChecked(),
+            "bar_position": bar_position,
+            "vertical": bar_position in ("Left", "Right"),
+            "centered_bar": self.centered_cb.isChecked(),
+            "dock_enabled": self.dock_cb.isChecked(),
+            "dock_always_show": self.dock_always_cb.isChecked(),
+            "dock_icon_size": self.dock_size_slider.value(),
+            "bar_workspace_show_number": self.ws_num_cb.isChecked(),
+            "bar_workspace_use_runes": self.ws_runes_cb.isChecked(),
+            "bar_hide_special_workspace": self.special_ws_cb.isChecked(),
+            "bar_theme": self.bar_theme_combo.currentText(),
+            "dock_theme": self.dock_theme_combo.currentText(),
+            "panel_theme": self.panel_theme_combo.currentText(),
+            "panel_position": self.panel_position_combo.currentText(),
+            "notif_pos": self.notif_pos_combo.currentText(),
+            "corners_visible": self.corners_cb.isChecked(),
+        })
 
-        # Metrics
-        settings["metrics_visible"] = {k: cb.isChecked() for k, cb in self.metrics_switches.items()}
-        settings["metrics_small_visible"] = {k: cb.isChecked() for k, cb in self.metrics_small_switches.items()}
+        # Component visibility
+        settings.update(
+            {f"bar_{name}_visible": cb.isChecked() for name, cb in self.component_switches.items()}
+        )
 
+    def _collect_system_settings(self, settings: dict) -> None:
+        """Collect System tab settings into settings."""
         # Disk paths
-        disk_paths = []
-        for container in self.disk_entries:
-            layout = container.layout()
-            if layout and layout.count() > 0:
-                entry = layout.itemAt(0).widget() # pyright: ignore[reportOptionalMemberAccess]
-                if isinstance(entry, QLineEdit) and entry.text().strip():
-                    disk_paths.append(entry.text().strip())
-        settings["bar_metrics_disks"] = disk_paths if disk_paths else ["/"]
-
-        # Notification apps
-        settings["limited_apps_history"] = self._parse_app_list(self.limited_apps_entry.text())
-        settings["history_ignored_apps"] = self._parse_app_list(self.ignored_apps_entry.text())
-
-        return settings
+        disk_paths = [path for entry in self.disk_entries.values() if (path := entry.text().strip())]
+
+        settings.update({
+            "auto_append_hyprland": self.auto_append_cb.isChecked(),
+            "terminal_command": self.terminal_entry.text(),
+            # Monitors, in one pass (an empty list means all monitors)
+            "selected_monitors": [name for name, cb in self.monitor_checkboxes.items() if cb.isChecked()],
+            # Metrics
+            "metrics_visible": {k: cb.isChecked() for k, cb in self.metrics_switches.items()},
+            "metrics_small_visible": {k: cb.isChecked() for k, cb in self.metrics_small_switches.items()},
+            "bar_metrics_disks": disk_paths if disk_paths else ["/"],
+            # Notification apps
+            "limited_apps_history": self._parse_app_list(self.limited_apps_entry.text()),
+            "history_ignored_apps": self._parse_app_list(self.ignored_apps_entry.text()),
+        })
 
     def _parse_app_list(self, text: str) -> list:
         """Parse comma-separated app list."""
@@ -938,20 +1036,22 @@ class AwShellSettings(FramelessMainWindow):
             try:
                 from PIL import Image
                 img = Image.open(self.selected_face_icon)
+                # Let JPEG decode at a reduced scale (no-op for other formats)
+                img.draft(None, (FACE_ICON_MIN_SIZE, FACE_ICON_MIN_SIZE))
                 side = min(img.size)
                 left = (img.width - side) // 2
                 top = (img.height - side) // 2
                 cropped = img.crop((left, top, left + side, top + side))
                 face_dest = os.path.expanduser("~/.face.icon")
-                cropped.save(face_dest, format="PNG")
+                cropped.save(face_dest, format="PNG", compress_level=3)
                 self.selected_face_icon = None
                 self.face_status_label.setText("")
             except Exception as e:
                 print(f"Error processing face icon: {e}")
 
         # Get lock/idle checkbox states
-        replace_lock = hasattr(self, 'lock_cb') and self.lock_cb.isChecked()
-        replace_idle = hasattr(self, 'idle_cb') and self.idle_cb.isChecked()
+        replace_lock = self.lock_cb is not None and self.lock_cb.isChecked()
+        replace_idle = self.idle_cb is not None and self.idle_cb.isChecked()
 
         # Apply and restart
         self.bridge.apply_and_restart(replace_lock, replace_idle)
@@ -972,35 +1072,72 @@ class AwShellSettings(FramelessMainWindow):
             self._reload_widgets_from_bridge()
 
     def _reload_widgets_from_bridge(self) -> None:
-        """Reload all widget values from the bridge."""
-        # Keybindings
-        for prefix_key, suffix_key, prefix_entry, suffix_entry in self.keybind_entries:
-            prefix_entry.setText(str(self.bridge.get(prefix_key, "")))
-            suffix_entry.setText(str(self.bridge.get(suffix_key, "")))
+        """Reload all widget values from the bridge.
 
-        # Appearance
+        Tabs that were never opened read the bridge when they are built.
+        """
+        get = self.bridge.get
+
+        # Repaint once after all widgets are reset instead of per setter
+        self.setUpdatesEnabled(False)
+        try:
+            # Keybindings
+            for prefix_key, suffix_key, prefix_entry, suffix_entry in self.keybind_entries:
+                prefix_entry.setText(str(get(prefix_key, "")))
+                suffix_entry.setText(str(get(suffix_key, "")))
+
+            if "Appearance" in self._built_tabs:
+                self._reload_appearance_widgets()
+            if "System" in self._built_tabs:
+                self._reload_system_widgets()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _reload_appearance_widgets(self) -> None:
+        """Reload Appearance tab widgets from the bridge."""
         self.wall_dir_entry.setText(str(self.bridge.get("wallpapers_dir", "")))
         self.datetime_12h_cb.setChecked(self.bridge.get("datetime_12h_format", False))
-        self.position_combo.setCurrentText(str(self.bridge.get("bar_position", "Top")))
-        self.centered_cb.setChecked(self.bridge.get("centered_bar", False))
-        self.dock_cb.setChecked(self.bridge.get("dock_enabled", True))
-        self.dock_always_cb.setChecked(self.bridge.get("dock_always_show", False))
+        # The dependent-state handlers run once below, so silence their
+        # per-setter signals while the values are restored
+        with (
+            QSignalBlocker(self.position_combo),
+            QSignalBlocker(self.dock_cb),
+            QSignalBlocker(self.ws_num_cb),
+            QSignalBlocker(self.panel_theme_combo),
+        ):
+            self.position_combo.setCurrentText(str(self.bridge.get("bar_position", "Top")))
+            self.centered_cb.setChecked(self.bridge.get("centered_bar", False))
+            self.dock_cb.setChecked(self.bridge.get("dock_enabled", True))
+            self.dock_always_cb.setChecked(self.bridge.get("dock_always_show", False))
+            self.ws_num_cb.setChecked(self.bridge.get("bar_workspace_show_number", False))
+            self.ws_runes_cb.setChecked(self.bridge.get("bar_workspace_use_runes", False))
+            self.panel_theme_combo.setCurrentText(str(self.bridge.get("panel_theme", "Notch")))
         self.dock_size_slider.setValue(int(self.bridge.get("dock_icon_size", 28)))
-        self.ws_num_cb.setChecked(self.bridge.get("bar_workspace_show_number", False))
-        self.ws_runes_cb.setChecked(self.bridge.get("bar_workspace_use_runes", False))
         self.special_ws_cb.setChecked(self.bridge.get("bar_hide_special_workspace", True))
         self.bar_theme_combo.setCurrentText(str(self.bridge.get("bar_theme", "Pills")))
         self.dock_theme_combo.setCurrentText(str(self.bridge.get("dock_theme", "Pills")))
-        self.panel_theme_combo.setCurrentText(str(self.bridge.get("panel_theme", "Notch")))
         self.panel_position_combo.setCurrentText(str(self.bridge.get("panel_position", "Center")))
         self.notif_pos_combo.setCurrentText(str(self.bridge.get("notif_pos", "Top")))
         self.corners_cb.setChecked(self.bridge.get("corners_visible", True))
 
         # Component switches
+        get = self.bridge.get
         for name, cb in self.component_switches.items():
-            cb.setChecked(self.bridge.get(f"bar_{name}_visible", True))
+            cb.setChecked(get(f"bar_{name}_visible", True))
 
-        # System
+        # Face icon
+        self._load_face_icon()
+        self.face_status_label.setText("")
+        self.selected_face_icon = None
+
+        # Update dependent states
+        self._on_position_changed(self.position_combo.currentText())
+        self._on_dock_changed(Qt.CheckState.Checked.value if self.dock_cb.isChecked() else Qt.CheckState.Unchecked.value)
+        self._on_ws_num_changed(Qt.CheckState.Checked.value if self.ws_num_cb.isChecked() else Qt.CheckState.Unchecked.value)
+        self._on_panel_theme_changed(self.panel_theme_combo.currentText())
+
+    def _reload_system_widgets(self) -> None:
+        """Reload System tab widgets from the bridge."""
         self.auto_append_cb.setChecked(self.bridge.get("auto_append_hyprland", True))
         self.terminal_entry.setText(str(self.bridge.get("terminal_command", "kitty -e")))
 
@@ -1019,9 +1156,10 @@ class AwShellSettings(FramelessMainWindow):
         for k, cb in self.metrics_small_switches.items():
             cb.setChecked(metrics_small_vis.get(k, True))
 
-        # Disk entries
-        for container in self.disk_entries[:]:
-            self._remove_disk_entry(container)
+        # Disk entries: drop them all at once rather than one remove() each
+        for container in self.disk_entries:
+            container.deleteLater()
+        self.disk_entries.clear()
         for path in self.bridge.get("bar_metrics_disks", ["/"]):
             self._add_disk_entry(path)
 
@@ -1032,22 +1170,11 @@ class AwShellSettings(FramelessMainWindow):
         self.ignored_apps_entry.setText(", ".join(f'"{app}"' for app in ignored_list))
 
         # Reset lock/idle checkboxes
-        if hasattr(self, 'lock_cb'):
+        if self.lock_cb is not None:
             self.lock_cb.setChecked(False)
-        if hasattr(self, 'idle_cb'):
+        if self.idle_cb is not None:
             self.idle_cb.setChecked(False)
 
-        # Face icon
-        self._load_face_icon()
-        self.face_status_label.setText("")
-        self.selected_face_icon = None
-
-        # Update dependent states
-        self._on_position_changed(self.position_combo.currentText())
-        self._on_dock_changed(Qt.CheckState.Checked.value if self.dock_cb.isChecked() else Qt.CheckState.Unchecked.value)
-        self._on_ws_num_changed(Qt.CheckState.Checked.value if self.ws_num_cb.isChecked() else Qt.CheckState.Unchecked.value)
-        self._on_panel_theme_changed(self.panel_theme_combo.currentText())
-
 
 def main():
     app = QApplication(sys.argv)
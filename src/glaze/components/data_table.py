@@ -2,19 +2,136 @@ import sys
 import csv
 import os
 
+from collections.abc import Iterable, Iterator
+
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QPushButton, QHeaderView, QLineEdit,
+    QTableView, QPushButton, QHeaderView, QLineEdit,
     QDialog, QFormLayout, QComboBox, QMessageBox, QFileDialog, QFrame,
-    QGraphicsDropShadowEffect, QGridLayout, QLabel
+    QGridLayout, QLabel
+)
+from PySide6.QtCore import (
+    Qt, QTimer, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, Signal,
+    QSortFilterProxyModel,
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
 
 from glaze.theme import get_dialog_stylesheet, get_table_container_style
 from glaze.widgets import ThemedComboBox, RoundedHeaderView, FramelessMainWindow
 
 DATA_FILE = "users.csv"
+HEADERS = ("ID", "Name", "Email", "Status")
+# Typing pause (ms) before the search filter runs
+FILTER_DELAY_MS = 150
+# Quiet period (ms) after an edit before the CSV is rewritten
+SAVE_DELAY_MS = 500
+# Larger than the 8 KiB default so big user files take fewer read/write calls
+CSV_BUFFER_SIZE = 1 << 20
+
+UserRecord = tuple[str, str, str, str]
+
+
+class UserTableModel(QAbstractTableModel):
+    """Read-only user table model.
+
+    Users are stored column-wise (one list per field) so loading a file
+    needs no per-cell item objects.
+    """
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._columns: tuple[list[str], ...] = tuple([] for _ in HEADERS)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns[0])
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> str | None:
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._columns[index.column()][index.row()]
+        return None
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> str | None:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return HEADERS[section]
+        return None
+
+    def set_users(self, users: Iterable[UserRecord]) -> None:
+        """Replace all users."""
+        self.beginResetModel()
+        self._columns = tuple(list(column) for column in zip(*users)) or tuple([] for _ in HEADERS)
+        self.endResetModel()
+
+    def user(self, row: int) -> UserRecord:
+        return tuple(column[row] for column in self._columns)  # type: ignore[return-value]
+
+    def users(self) -> Iterator[UserRecord]:
+        return zip(*self._columns)
+
+    def ids(self) -> list[str]:
+        return self._columns[0]
+
+    def append_user(self, user: UserRecord) -> None:
+        row = self.rowCount()
+        self.beginInsertRows(QModelIndex(), row, row)
+        for column, value in zip(self._columns, user):
+            column.append(value)
+        self.endInsertRows()
+
+    def set_user(self, row: int, user: UserRecord) -> None:
+        for column, value in zip(self._columns, user):
+            column[row] = value
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(HEADERS) - 1))
+
+    def remove_users(self, rows: Iterable[int]) -> None:
+        """Remove rows, with one model event per contiguous run."""
+        runs: list[list[int]] = []
+        # Bottom-up, so removing a run doesn't shift the ones still pending
+        for row in sorted(rows, reverse=True):
+            if runs and runs[-1][0] == row + 1:
+                runs[-1][0] = row
+            else:
+                runs.append([row, row])
+        for first, last in runs:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for column in self._columns:
+                del column[first:last + 1]
+            self.endRemoveRows()
+
+
+class _ExportWorkerSignals(QObject):
+    """Signals emitted by _ExportWorker (QRunnable can't define signals)."""
+
+    finished = Signal(str)  # exported path
+    failed = Signal(str)  # error message
+
+
+class _ExportWorker(QRunnable):
+    """Write a snapshot of the users to a CSV file on a pool thread."""
+
+    def __init__(self, path: str, users: list[UserRecord]):
+        super().__init__()
+        self.path = path
+        self.users = users
+        self.signals = _ExportWorkerSignals()
+
+    def run(self):
+        try:
+            with open(self.path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(HEADERS)
+                writer.writerows(self.users)
+        except OSError as e:
+            self.signals.failed.emit(str(e))
+        except Exception as e:
+            # Anything else (csv.Error, UnicodeEncodeError, ...) must still
+            # reach the GUI thread, or the Export button stays disabled
+            self.signals.failed.emit(f"Error: {e}")
+        else:
+            self.signals.finished.emit(self.path)
 
 
 class UserDialog(QDialog):
@@ -107,8 +224,22 @@ class DataTableWindow(FramelessMainWindow):
 
     def __init__(self):
         super().__init__(width=750, height=550, title="User Management")
+        # Highest numeric user ID seen, so new IDs don't need a full scan
+        self._max_id = 0
+        # Back-to-back edits share a single rewrite of the CSV
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._save_data)
         self.load_data()
 
+    def closeEvent(self, event):
+        """Flush a pending save before closing."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._save_data()
+        super().closeEvent(event)
+
     def setup_content(self) -> None:
         self.content_layout.setContentsMargins(20, 20, 20, 20)
         self.content_layout.setSpacing(16)
@@ -117,7 +248,12 @@ class DataTableWindow(FramelessMainWindow):
         self.search = QLineEdit()
         self.search.setPlaceholderText("Search users...")
         self.search.setFixedHeight(42)
-        self.search.textChanged.connect(self.filter_table)
+        # Coalesce keystrokes so a typed word filters the table once
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.search.textChanged.connect(lambda _text: self._filter_timer.start())
         toolbar.addWidget(self.search)
 
         self.add_btn = QPushButton("+ Add User")
@@ -126,23 +262,21 @@ class DataTableWindow(FramelessMainWindow):
         toolbar.addWidget(self.add_btn)
         self.content_layout.addLayout(toolbar)
 
-        # Table container with shadow
+        # Table container; its themed border outlines the table, no blur effect
         table_container = QFrame()
         table_container.setObjectName("tableContainer")
         table_container.setStyleSheet(get_table_container_style())
         table_layout = QVBoxLayout(table_container)
         table_layout.setContentsMargins(0, 0, 0, 0)
 
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(25)
-        shadow.setXOffset(0)
-        shadow.setYOffset(4)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        table_container.setGraphicsEffect(shadow)
-
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["ID", "Name", "Email", "Status"])
+        self.model = UserTableModel(self)
+        # Search filtering runs in Qt's C++ proxy rather than a Python row loop
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.proxy.setFilterKeyColumn(-1)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         self.table.doubleClicked.connect(self.edit_selected_user)
         self.table.setShowGrid(False)
         self.table.setFrameShape(QFrame.Shape.NoFrame)
@@ -151,7 +285,7 @@ class DataTableWindow(FramelessMainWindow):
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.table.setHorizontalHeader(header)
 
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
 
         if (v_header := self.table.verticalHeader()) is not None:
@@ -188,80 +322,58 @@ class DataTableWindow(FramelessMainWindow):
             return
 
         try:
-            with open(DATA_FILE, "r", newline="", encoding="utf-8") as f:
+            with open(DATA_FILE, "r", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
                 reader = csv.reader(f)
                 next(reader, None)
-                data = [(row[0], row[1], row[2], row[3]) for row in reader if len(row) == 4]
-
-            self.table.setRowCount(len(data))
-            for row, record in enumerate(data):
-                self._set_row_data(row, record)
+                # Rows go straight into the model's columns, no per-row tuples
+                self.model.set_users(row for row in reader if len(row) == 4)
+            self._max_id = max(
+                (int(user_id) for user_id in self.model.ids() if user_id.isdecimal()), default=0
+            )
 
         except OSError as e:
             QMessageBox.warning(self, "Load Failed", f"Could not load data: {e}")
 
-    def _set_row_data(self, row: int, data: tuple[str, str, str, str]) -> None:
-        for col, val in enumerate(data):
-            item = QTableWidgetItem(val)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, col, item)
-
-    def _get_row_data(self, row: int) -> tuple[str, str, str, str] | None:
-        items = [self.table.item(row, col) for col in range(4)]
-        if all(items):
-            return tuple(item.text() for item in items)  # type: ignore[return-value]
-        return None
-
-    def _generate_next_id(self) -> str:
-        max_id = 0
-        for row in range(self.table.rowCount()):
-            if item := self.table.item(row, 0):
-                try:
-                    max_id = max(max_id, int(item.text()))
-                except ValueError:
-                    pass
-        return f"{max_id + 1:03d}"
-
     def _save_data(self) -> None:
         try:
-            with open(DATA_FILE, "w", newline="", encoding="utf-8") as f:
+            with open(DATA_FILE, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
-                writer.writerow(["ID", "Name", "Email", "Status"])
-                for row in range(self.table.rowCount()):
-                    if row_data := self._get_row_data(row):
-                        writer.writerow(row_data)
+                writer.writerow(HEADERS)
+                writer.writerows(self.model.users())
         except OSError:
             pass
 
+    def _mark_dirty(self) -> None:
+        self._save_timer.start()
+
     def add_user(self) -> None:
         dialog = UserDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             name, email, status = dialog.get_data()
-            new_id = self._generate_next_id()
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self._set_row_data(row, (new_id, name, email, status))
-            self._save_data()
+            self._max_id += 1
+            new_id = f"{self._max_id:03d}"
+            self.model.append_user((new_id, name, email, status))
+            self._mark_dirty()
 
     def edit_selected_user(self) -> None:
-        selected = self.table.selectedItems()
+        selected = self.table.selectionModel().selectedIndexes()
         if not selected:
             QMessageBox.information(self, "No Selection", "Please select a user to edit.")
             return
 
-        row = selected[0].row()
-        current_data = self._get_row_data(row)
-        if current_data is None:
-            return
+        row = self.proxy.mapToSource(selected[0]).row()
+        current_data = self.model.user(row)
 
         dialog = UserDialog(self, current_data)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             name, email, status = dialog.get_data()
-            self._set_row_data(row, (current_data[0], name, email, status))
-            self._save_data()
+            self.model.set_user(row, (current_data[0], name, email, status))
+            self._mark_dirty()
 
     def delete_selected(self) -> None:
-        selected_rows = sorted(set(item.row() for item in self.table.selectedItems()), reverse=True)
+        selected_rows = [
+            self.proxy.mapToSource(index).row() for index in self.table.selectionModel().selectedRows()
+        ]
         if not selected_rows:
             QMessageBox.information(self, "No Selection", "Please select user(s) to delete.")
             return
@@ -275,9 +387,8 @@ class DataTableWindow(FramelessMainWindow):
         )
 
         if confirm == QMessageBox.StandardButton.Yes:
-            for row in selected_rows:
-                self.table.removeRow(row)
-            self._save_data()
+            self.model.remove_users(selected_rows)
+            self._mark_dirty()
 
     def export_to_csv(self) -> None:
         path, _ = QFileDialog.getSaveFileName(
@@ -286,37 +397,36 @@ class DataTableWindow(FramelessMainWindow):
         if not path:
             return
 
-        try:
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                headers = [
-                    item.text()
-                    for col in range(self.table.columnCount())
-                    if (item := self.table.horizontalHeaderItem(col)) is not None
-                ]
-                writer.writerow(headers)
-                for row in range(self.table.rowCount()):
-                    row_data = self._get_row_data(row)
-                    if row_data:
-                        writer.writerow(row_data)
-            QMessageBox.information(self, "Export Complete", f"Exported to {path}")
-        except OSError as e:
-            QMessageBox.critical(self, "Export Failed", str(e))
+        # Write off the GUI thread; the snapshot keeps later edits out of
+        # the file while it is being written
+        worker = _ExportWorker(path, list(self.model.users()))
+        worker.signals.finished.connect(self._on_export_finished)
+        worker.signals.failed.connect(self._on_export_failed)
+        self.export_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_export_finished(self, path: str) -> None:
+        self.export_btn.setEnabled(True)
+        QMessageBox.information(self, "Export Complete", f"Exported to {path}")
+
+    def _on_export_failed(self, message: str) -> None:
+        self.export_btn.setEnabled(True)
+        QMessageBox.critical(self, "Export Failed", message)
+
+    def _apply_filter(self) -> None:
+        self.filter_table(self.search.text())
 
     def filter_table(self, text: str) -> None:
-        for row in range(self.table.rowCount()):
-            match = any(
-                (item := self.table.item(row, col)) is not None
-                and text.lower() in item.text().lower()
-                for col in range(self.table.columnCount())
-            )
-            self.table.setRowHidden(row, not match)
+        self.proxy.setFilterFixedString(text)
 
 
 def main():
     app = QApplication(sys.argv)
     window = DataTableWindow()
     window.show()
+    # Quit right after startup (build.py --pgo uses this as the profiling run)
+    if "--self-test" in sys.argv:
+        QTimer.singleShot(0, app.quit)
     sys.exit(app.exec())
 
 
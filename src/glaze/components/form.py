@@ -2,7 +2,7 @@ import sys
 from PySide6.QtWidgets import (
     QApplication, QLabel, QLineEdit, QPushButton, QMessageBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont
 
 from glaze.widgets import ThemedComboBox, FramelessMainWindow
@@ -73,6 +73,9 @@ def main():
     app = QApplication(sys.argv)
     window = LoginWindow()
     window.show()
+    # Quit right after startup (build.py --pgo uses this as the profiling run)
+    if "--self-test" in sys.argv:
+        QTimer.singleShot(0, app.quit)
     sys.exit(app.exec())
 
 
@@ -10,7 +10,7 @@ A professional settings dialog with:
 from typing import cast
 import sys
 from pathlib import Path
-from PySide6.QtCore import Qt, QSettings
+from PySide6.QtCore import Qt, QSettings, QTimer
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QApplication,
@@ -43,6 +43,7 @@ from glaze.color_backend import (
     MATUGEN_SCHEMES, SCHEME_DISPLAY_NAMES, Backend
 )
 from glaze.matugen import is_matugen_available
+from glaze.wayland import is_system_dark_mode
 import glaze
 
 
@@ -343,9 +344,10 @@ class SettingsDialog(FramelessMainWindow):
 
         self.scheme_combo = ThemedComboBox()
         self.scheme_combo.setMinimumHeight(36)
-        for scheme in MATUGEN_SCHEMES:
-            display_name = SCHEME_DISPLAY_NAMES.get(scheme, scheme)
-            self.scheme_combo.addItem(display_name, scheme)
+        self.scheme_combo.set_items(
+            (SCHEME_DISPLAY_NAMES.get(scheme, scheme), scheme)
+            for scheme in MATUGEN_SCHEMES
+        )
         scheme_layout.addWidget(self.scheme_combo)
         theme_layout.addLayout(scheme_layout)
 
@@ -580,35 +582,12 @@ class SettingsDialog(FramelessMainWindow):
         """Get dark mode based on selected mode (System/Dark/Light)."""
         checked_id = self.theme_group.checkedId()
         if checked_id == 0:  # System
-            return self._detect_system_dark_mode()
+            return is_system_dark_mode()
         elif checked_id == 1:  # Dark
             return True
         else:  # Light
             return False
 
-    def _detect_system_dark_mode(self) -> bool:
-        """Detect system dark mode preference."""
-        import subprocess
-        try:
-            result = subprocess.run(
-                ["gsettings", "get", "org.gnome.desktop.interface", "color-scheme"],
-                capture_output=True, text=True, timeout=2
-            )
-            if result.returncode == 0:
-                return "dark" in result.stdout.lower()
-        except Exception:
-            pass
-        try:
-            result = subprocess.run(
-                ["gsettings", "get", "org.gnome.desktop.interface", "gtk-theme"],
-                capture_output=True, text=True, timeout=2
-            )
-            if result.returncode == 0:
-                return "dark" in result.stdout.lower()
-        except Exception:
-            pass
-        return True  # Default to dark
-
     def _apply_theme(self):
         """Apply theme from wallpaper with selected scheme and backend."""
         wallpaper = self.wallpaper_path.text()
@@ -671,7 +650,6 @@ class SettingsDialog(FramelessMainWindow):
             self.theme_status_label.setStyleSheet(f"color: {t.accent};")
 
         # Reset after 3 seconds
-        from PySide6.QtCore import QTimer
         backend_info = get_backend_info()
         matugen_status = "installed" if backend_info["matugen"] else "not found"
 
@@ -819,6 +797,9 @@ def main():
     app = QApplication(sys.argv)
     dialog = SettingsDialog()
     dialog.show()
+    # Quit right after startup (build.py --pgo uses this as the profiling run)
+    if "--self-test" in sys.argv:
+        QTimer.singleShot(0, app.quit)
     sys.exit(app.exec())
 
 
@@ -9,7 +9,7 @@ from typing import Tuple, List
 import colorsys
 
 
-@dataclass
+@dataclass(slots=True)
 class MaterialPalette:
     """Material You color palette extracted from an image."""
 
@@ -189,9 +189,10 @@ def get_contrasting_text(hex_color: str) -> str:
         "#ffffff" for dark backgrounds, "#000000" for light backgrounds
     """
     r, g, b = hex_to_rgb(hex_color)
-    # Calculate relative luminance (WCAG formula)
-    luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-    return "#000000" if luminance > 0.5 else "#ffffff"
+    # Relative luminance (Rec. 601 weights) in integer fixed point:
+    # (0.299r + 0.587g + 0.114b) / 255 > 0.5, scaled by 1000 * 255
+    luminance = 299 * r + 587 * g + 114 * b
+    return "#000000" if luminance > 127_500 else "#ffffff"
 
 
 def extract_dominant_color(image_path: str, sample_size: int = 150) -> str:
@@ -210,34 +211,29 @@ def extract_dominant_color(image_path: str, sample_size: int = 150) -> str:
     """
     try:
         from PIL import Image
-        from PIL.Image import core as Imaging
     except ImportError:
         raise ImportError(
             "Pillow is required for image color extraction. "
             "Install it with: pip install pillow"
         )
 
-    # Load and resize image for faster processing
+    # Load and resize image for faster processing. draft() lets the JPEG
+    # decoder downscale while decoding, so full-resolution wallpapers are
+    # never decoded at full size; bilinear is plenty for color counting.
     img = Image.open(image_path)
+    img.draft('RGB', (sample_size, sample_size))
     img = img.convert('RGB')
-    img.thumbnail((sample_size, sample_size))
+    img.thumbnail((sample_size, sample_size), Image.Resampling.BILINEAR)
 
-    # Get color histogram
-    pixels: Imaging.ImagingCore = img.getdata()
+    # Group similar colors by rounding each channel down to a multiple of 32
+    # (8 levels per channel), using a lookup table applied in C
+    img = img.point([(c // 32) * 32 for c in range(256)] * 3)
 
-    # Find dominant color using color quantization
-    from collections import Counter
-
-    # Group similar colors (reduce precision to avoid too many unique colors)
-    def simplify_color(rgb):
-        # Round to nearest 32 to group similar colors
-        return tuple((c // 32) * 32 for c in rgb)
-
-    simplified_pixels = [simplify_color(p) for p in pixels]
-    color_counts = Counter(simplified_pixels)
+    # Count colors in C; at most 8**3 distinct values remain after rounding
+    color_counts = img.getcolors(maxcolors=8 ** 3)
 
     # Get most common color
-    dominant_rgb = color_counts.most_common(1)[0][0]
+    _, dominant_rgb = max(color_counts, key=lambda item: item[0])
 
     return rgb_to_hex(*dominant_rgb)
 
@@ -21,6 +21,7 @@ Install matugen:
 
 from __future__ import annotations
 
+import functools
 import json
 import shutil
 import subprocess
@@ -57,9 +58,13 @@ SCHEME_DISPLAY_NAMES = {
 }
 
 
+@functools.cache
 def is_matugen_available() -> bool:
     """Check if matugen is installed and available in PATH.
 
+    The PATH scan runs once per process; call
+    `is_matugen_available.cache_clear()` to re-check after installing matugen.
+
     Returns:
         True if matugen is available, False otherwise
     """
@@ -0,0 +1,48 @@
+"""Single entry point that runs a component chosen by executable name.
+
+`python build.py --multiplex` compiles this module into one binary and
+symlinks every component name in dist/ to it, so the shared glaze package
+is analyzed and compiled once instead of once per component.
+
+This module also holds the component table used by build.py, which loads
+it by path; keep it free of Qt and glaze imports.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+# Component definitions: name -> (module_path, output_name); each module
+# has a main()
+COMPONENTS = {
+    "launcher": ("glaze.__main__", "glaze-launcher"),
+    "form": ("glaze.components.form", "login-form"),
+    "data_table": ("glaze.components.data_table", "data-table"),
+    "settings": ("glaze.components.settings", "settings-dialog"),
+}
+
+# Executable name -> component module
+COMPONENT_MODULES = {output_name: module_path for module_path, output_name in COMPONENTS.values()}
+
+
+def _invoked_name() -> str:
+    """Return the name this binary was started as.
+
+    A Nuitka onefile binary may see its resolved path in sys.argv[0]; the
+    name of the symlink that was run is kept in __compiled__.original_argv0.
+    """
+    compiled = globals().get("__compiled__")
+    argv0 = getattr(compiled, "original_argv0", None) or sys.argv[0]
+    return Path(argv0).name
+
+
+def main():
+    name = _invoked_name()
+    module_path = COMPONENT_MODULES.get(name)
+    if module_path is None:
+        sys.exit(f"{name}: unknown component; run as one of: {', '.join(COMPONENT_MODULES)}")
+    importlib.import_module(module_path).main()
+
+
+if __name__ == "__main__":
+    main()
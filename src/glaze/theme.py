@@ -1,5 +1,6 @@
 """Centralized theme configuration for PySide6 applications."""
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -12,7 +13,7 @@ if TYPE_CHECKING:
     from .material_colors import MaterialPalette
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Theme:
     # Background colors
     bg_primary: str = "#1a1a2e"
@@ -228,7 +229,13 @@ def get_table_container_style(custom_theme: Theme | None = None) -> str:
     Returns:
         CSS stylesheet string
     """
-    t = custom_theme or get_current_theme()
+    return _table_container_style(custom_theme or get_current_theme())
+
+
+# Memoized per Theme (frozen, hashable) so reopening a dialog or window
+# doesn't rebuild the same stylesheet
+@functools.lru_cache(maxsize=8)
+def _table_container_style(t: Theme) -> str:
     return f"""
         QFrame#tableContainer {{
             background-color: {t.bg_secondary};
@@ -503,29 +510,29 @@ def get_base_stylesheet(custom_theme: Theme | None = None) -> str:
         {_get_input_styles(t)}
         {_get_combobox_dropdown_styles(t)}
 
-        QTableWidget {{
+        QTableView {{
             color: {t.text_primary};
             border: none;
             background: transparent;  /* Changed: let container show through */
             gridline-color: transparent;
             outline: none;
         }}
-        QTableWidget::item {{
+        QTableView::item {{
             background-color: {t.bg_secondary};
             padding: 12px 8px;
             border-bottom: 1px solid {t.border};
         }}
-        QTableWidget::item:alternate {{
+        QTableView::item:alternate {{
             background-color: {t.table_row_alt};
         }}
-        QTableWidget::item:hover {{
+        QTableView::item:hover {{
             background-color: {t.table_row_hover};
         }}
-        QTableWidget::item:selected {{
+        QTableView::item:selected {{
             background-color: {t.accent};
             color: {t.accent_text};
         }}
-        QTableWidget::item:selected:hover {{
+        QTableView::item:selected:hover {{
             background-color: {t.accent_hover};
             color: {t.accent_hover_text};
         }}
@@ -542,11 +549,11 @@ def get_base_stylesheet(custom_theme: Theme | None = None) -> str:
         }}
 
         /* Make table viewport transparent */
-        QTableWidget QAbstractScrollArea {{
+        QTableView QAbstractScrollArea {{
             background: transparent;
         }}
 
-        QTableWidget QWidget {{
+        QTableView QWidget {{
             background: transparent;
         }}
 
@@ -564,7 +571,12 @@ def get_dialog_stylesheet(custom_theme: Theme | None = None) -> str:
     Returns:
         CSS stylesheet string
     """
-    t = custom_theme or get_current_theme()
+    return _dialog_stylesheet(custom_theme or get_current_theme())
+
+
+# Cached per Theme, like _table_container_style
+@functools.lru_cache(maxsize=8)
+def _dialog_stylesheet(t: Theme) -> str:
     return f"""
         QDialog {{
             background-color: {t.bg_primary};
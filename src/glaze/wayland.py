@@ -164,6 +164,117 @@ def get_desktop_environment() -> str:
     return "unknown"
 
 
+# Cached by is_system_dark_mode(); reset when the settings portal reports a change
+_system_dark_mode: bool | None = None
+_portal_watcher = None
+
+_PORTAL_SERVICE = "org.freedesktop.portal.Desktop"
+_PORTAL_PATH = "/org/freedesktop/portal/desktop"
+_PORTAL_SETTINGS = "org.freedesktop.portal.Settings"
+
+
+def _read_portal_color_scheme() -> int | None:
+    """Read the freedesktop color-scheme preference from the settings portal.
+
+    Returns:
+        0 (no preference), 1 (prefer dark), 2 (prefer light), or None if
+        the portal is not reachable
+    """
+    from PySide6.QtDBus import QDBusConnection, QDBusInterface, QDBusMessage, QDBusVariant
+
+    bus = QDBusConnection.sessionBus()
+    if not bus.isConnected():
+        return None
+
+    portal = QDBusInterface(_PORTAL_SERVICE, _PORTAL_PATH, _PORTAL_SETTINGS, bus)
+    portal.setTimeout(200)
+    reply = portal.call("Read", "org.freedesktop.appearance", "color-scheme")
+    if reply.type() != QDBusMessage.MessageType.ReplyMessage or not reply.arguments():
+        return None
+
+    # Read() wraps the value in (up to two) variants
+    value = reply.arguments()[0]
+    while isinstance(value, QDBusVariant):
+        value = value.variant()
+    return value if isinstance(value, int) else None
+
+
+def _watch_portal_color_scheme():
+    """Invalidate the cached dark mode preference when the desktop changes it."""
+    global _portal_watcher
+    if _portal_watcher is not None:
+        return
+
+    from PySide6.QtCore import QObject, Slot
+    from PySide6.QtDBus import QDBusConnection, QDBusMessage
+
+    class _PortalWatcher(QObject):
+        @Slot(QDBusMessage)
+        def on_setting_changed(self, message: QDBusMessage):
+            global _system_dark_mode
+            namespace, key = message.arguments()[:2]
+            if namespace == "org.freedesktop.appearance" and key == "color-scheme":
+                _system_dark_mode = None
+
+    bus = QDBusConnection.sessionBus()
+    if not bus.isConnected():
+        return
+
+    _portal_watcher = _PortalWatcher()
+    bus.connect(
+        _PORTAL_SERVICE, _PORTAL_PATH, _PORTAL_SETTINGS, "SettingChanged",
+        _portal_watcher, "1on_setting_changed(QDBusMessage)",
+    )
+
+
+def _read_gsettings_dark_mode() -> bool | None:
+    """Guess the dark mode preference from GNOME's gsettings.
+
+    Returns:
+        True/False if gsettings answered, None otherwise
+    """
+    import subprocess
+    for key in ("color-scheme", "gtk-theme"):
+        try:
+            result = subprocess.run(
+                ["gsettings", "get", "org.gnome.desktop.interface", key],
+                capture_output=True, text=True, timeout=2
+            )
+        except Exception:
+            continue
+        if result.returncode == 0:
+            return "dark" in result.stdout.lower()
+    return None
+
+
+def is_system_dark_mode() -> bool:
+    """Detect the desktop's dark mode preference.
+
+    Asks the freedesktop settings portal over D-Bus, falling back to
+    gsettings (color-scheme, then GTK theme name). The answer is cached for
+    the process and refreshed when the portal signals a change.
+
+    Returns:
+        True if dark mode is preferred or detection fails, False for light
+    """
+    global _system_dark_mode
+    if _system_dark_mode is not None:
+        return _system_dark_mode
+
+    color_scheme = _read_portal_color_scheme()
+    if color_scheme in (1, 2):
+        _system_dark_mode = color_scheme == 1
+        _watch_portal_color_scheme()
+    else:
+        gsettings_dark = _read_gsettings_dark_mode()
+        # Default to dark mode if detection fails
+        _system_dark_mode = True if gsettings_dark is None else gsettings_dark
+        if color_scheme is not None:
+            _watch_portal_color_scheme()
+
+    return _system_dark_mode
+
+
 def setup_hyprland_window(window: QWidget):
     """Configure a QWidget/QMainWindow for optimal tiling WM compatibility.
 
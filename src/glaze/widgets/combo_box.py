@@ -1,7 +1,10 @@
 """Themed ComboBox widget with proper Linux Qt6 dropdown styling."""
 
+from collections.abc import Iterable
+
 from PySide6.QtWidgets import QComboBox, QListView, QFrame
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 
 
 def _get_popup_frame_style(t) -> str:
@@ -38,6 +41,20 @@ class ThemedComboBox(QComboBox):
             view.viewport().setStyleSheet(f"background-color: {theme.bg_secondary}; margin: 0; padding: 0;")  # type: ignore
         self.setView(view)
 
+    def set_items(self, items: Iterable[tuple[str, object]]) -> None:
+        """Replace all items in one model swap instead of per-item addItem().
+
+        Args:
+            items: (display text, user data) pairs
+        """
+        items = list(items)
+        model = QStandardItemModel(len(items), 1, self)
+        for row, (text, data) in enumerate(items):
+            item = QStandardItem(text)
+            item.setData(data, Qt.ItemDataRole.UserRole)
+            model.setItem(row, 0, item)
+        self.setModel(model)
+
     def showPopup(self):
         from glaze.theme import theme
 
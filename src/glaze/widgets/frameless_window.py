@@ -148,7 +148,11 @@ class FramelessMainWindow(QMainWindow):
             }
         """
         extra_styles = self.get_extra_stylesheet()
-        self.setStyleSheet(base_styles + frameless_styles + extra_styles)
+        styles = base_styles + frameless_styles + extra_styles
+        # setStyleSheet() re-parses and re-polishes every child widget, so
+        # skip it when the theme change didn't alter the stylesheet
+        if styles != self.styleSheet():
+            self.setStyleSheet(styles)
 
     def refresh_theme(self):
         """Refresh all theme-dependent elements.